@@ -8,8 +8,10 @@ frequently accessed data to improve performance and reduce database load.
 import json
 import hashlib
 import asyncio
+import time
+from collections import OrderedDict
 from functools import wraps
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from datetime import datetime, timedelta
 import logging
 
@@ -20,12 +22,38 @@ except ImportError:
     REDIS_AVAILABLE = False
     redis = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from .config import config
 from .exceptions import CacheError
 
 
 logger = logging.getLogger(__name__)
 
+# Cached results at least this large are (de)serialized in a worker thread so
+# encoding them does not stall the event loop
+_OFFLOAD_MIN_ROWS = 1000
+_OFFLOAD_MIN_BYTES = 1024 * 1024
+
+
+def _serialize(data: Any) -> Union[str, bytes]:
+    """Serialize data for Redis, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str)
+
+
+def _deserialize(payload: Union[str, bytes]) -> Any:
+    """Deserialize data read from Redis."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class QueryCache:
     """
@@ -136,7 +164,10 @@ class QueryCache:
             cached_data = await self.redis_client.get(cache_key)
             if cached_data:
                 # Parse JSON and add cache metadata
-                result = json.loads(cached_data)
+                if len(cached_data) >= _OFFLOAD_MIN_BYTES:
+                    result = await asyncio.to_thread(_deserialize, cached_data)
+                else:
+                    result = _deserialize(cached_data)
                 result['_cache_hit'] = True
                 result['_cache_key'] = cache_key
                 return result
@@ -173,7 +204,11 @@ class QueryCache:
             cache_data['_cache_ttl'] = ttl or self.default_ttl
             
             # Serialize and store
-            serialized = json.dumps(cache_data, default=str)
+            results = cache_data.get('results')
+            if isinstance(results, list) and len(results) >= _OFFLOAD_MIN_ROWS:
+                serialized = await asyncio.to_thread(_serialize, cache_data)
+            else:
+                serialized = _serialize(cache_data)
             ttl = ttl or self.default_ttl
             
             await self.redis_client.setex(cache_key, ttl, serialized)
@@ -346,6 +381,166 @@ class SchemaCache:
         return await self.query_cache.invalidate_cache(pattern=pattern)
 
 
+class AnswerCache:
+    """
+    In-process LRU cache of answers to natural language queries.
+    
+    An answer is reused only for the same question, asked against the same
+    connection, with the same structure for the tables it was translated
+    from. Entries expire after the TTL so outside writes show up, and
+    invalidate() drops a connection's answers once its data is modified.
+    
+    The *_shared methods also read and write a Redis-backed QueryCache, so
+    server processes reuse each other's answers. Answers are stored in their
+    JSON form in both tiers, so a cached answer has the same value types
+    whichever tier it comes from.
+    """
+    
+    def __init__(self, max_entries: int = 256, ttl: int = 60, query_cache: Optional["QueryCache"] = None):
+        """
+        Initialize the answer cache.
+        
+        Args:
+            max_entries: Maximum number of answers to keep (0 disables caching)
+            ttl: Seconds an answer stays valid
+            query_cache: Optional Redis cache shared between processes
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.query_cache = query_cache
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    @staticmethod
+    def connection_fingerprint(connection_info: Dict[str, Any]) -> str:
+        """Get a digest identifying the database a connection points at."""
+        serialized = json.dumps(connection_info, sort_keys=True, default=str)
+        return hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+    
+    def make_key(self, question: str, connection_info: Dict[str, Any], schemas: List[Any]) -> str:
+        """
+        Build the cache key for a question.
+        
+        Args:
+            question: Natural language question
+            connection_info: Sanitized connection info of the database manager
+            schemas: TableSchema objects the question is translated against
+            
+        Returns:
+            Cache key string, prefixed with the connection fingerprint
+        """
+        # Only whitespace is normalized; case can matter for literals in the question
+        normalized = " ".join(question.split())
+        digest = hashlib.blake2b(normalized.encode(), digest_size=16)
+        for schema in schemas:
+            digest.update(schema.fingerprint().encode())
+        return f"{self.connection_fingerprint(connection_info)}:{digest.hexdigest()}"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached answer, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, answer = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return self._copy(answer)
+    
+    @staticmethod
+    def _copy(answer: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy an answer and its lists so callers cannot change the cached entry."""
+        return {field: list(value) if isinstance(value, list) else value for field, value in answer.items()}
+    
+    def set(self, key: str, answer: Dict[str, Any]) -> None:
+        """Store an answer, evicting the least recently used ones beyond max_entries."""
+        if self.max_entries <= 0:
+            return
+        
+        self._entries[key] = (time.monotonic(), answer)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, connection_info: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Drop cached answers.
+        
+        Args:
+            connection_info: Only drop answers for this connection (all if None)
+            
+        Returns:
+            Number of answers dropped
+        """
+        if connection_info is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        
+        prefix = f"{self.connection_fingerprint(connection_info)}:"
+        stale_keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in stale_keys:
+            del self._entries[key]
+        return len(stale_keys)
+    
+    async def get_shared(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached answer from this process or, failing that, from Redis."""
+        answer = self.get(key)
+        if answer is not None or self.query_cache is None:
+            return answer
+        
+        shared = await self.query_cache.get_cached_result(f"answer:{key}")
+        if not shared:
+            return None
+        
+        # Drop the metadata QueryCache adds to stored entries
+        answer = {field: value for field, value in shared.items() if not field.startswith('_')}
+        self.set(key, answer)
+        return self._copy(answer)
+    
+    async def set_shared(self, key: str, answer: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store an answer in this process and in Redis.
+        
+        Args:
+            key: Cache key from make_key()
+            answer: Answer to store
+            
+        Returns:
+            Copy of the answer as stored, with values converted to their JSON form
+        """
+        # Round-trip through JSON so both tiers hold the types Redis gives back
+        results = answer.get("results")
+        if isinstance(results, list) and len(results) >= _OFFLOAD_MIN_ROWS:
+            stored = await asyncio.to_thread(lambda: _deserialize(_serialize(answer)))
+        else:
+            stored = _deserialize(_serialize(answer))
+        
+        self.set(key, stored)
+        if self.query_cache is not None:
+            await self.query_cache.cache_result(f"answer:{key}", stored, self.ttl)
+        return self._copy(stored)
+    
+    async def invalidate_shared(self, connection_info: Dict[str, Any]) -> int:
+        """
+        Drop a connection's answers from this process and from Redis.
+        
+        Args:
+            connection_info: Sanitized connection info of the database manager
+            
+        Returns:
+            Number of answers dropped in this process
+        """
+        count = self.invalidate(connection_info)
+        if self.query_cache is not None:
+            await self.query_cache.invalidate_cache(
+                pattern=f"answer:{self.connection_fingerprint(connection_info)}:*"
+            )
+        return count
+
+
 def cache_query_result(ttl: int = 300, cache_key_func=None):
     """
     Decorator for caching query results.
@@ -413,6 +608,12 @@ query_cache = QueryCache(
 
 schema_cache = SchemaCache(query_cache)
 
+answer_cache = AnswerCache(
+    max_entries=config.answer_cache_size if config else 256,
+    ttl=config.answer_cache_ttl if config else 60,
+    query_cache=query_cache
+)
+
 
 async def initialize_cache():
     """Initialize cache connections."""
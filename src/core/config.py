@@ -25,6 +25,10 @@ class DatabaseConfig(BaseSettings):
     password: str = Field(default="", description="Database password")
     database: str = Field(default="nlp_sql_db", description="Database name")
     db_type: str = Field(default="postgresql", description="Database type")
+    statement_cache_size: int = Field(
+        default=0,
+        description="Prepared statements cached per PostgreSQL connection (0 for pgbouncer)"
+    )
     
     @field_validator('db_type')
     @classmethod
@@ -43,6 +47,14 @@ class DatabaseConfig(BaseSettings):
             raise ValueError(f'Port must be between 1 and 65535, got: {v}')
         return v
     
+    @field_validator('statement_cache_size')
+    @classmethod
+    def validate_statement_cache_size(cls, v):
+        """Validate prepared statement cache size."""
+        if not 0 <= v <= 10000:
+            raise ValueError(f'Statement cache size must be between 0 and 10000, got: {v}')
+        return v
+    
     @field_validator('host')
     @classmethod
     def validate_host(cls, v):
@@ -152,6 +164,7 @@ class Config(BaseSettings):
     # Environment settings
     environment: str = Field(default="development", description="Environment")
     debug: bool = Field(default=False, description="Debug mode")
+    tool_log_level: str = Field(default="info", description="Lowest level of progress messages tools send to clients")
     
     # Feature flags
     enable_query_caching: bool = Field(default=True, description="Enable query caching")
@@ -163,10 +176,25 @@ class Config(BaseSettings):
     # Cache settings
     cache_redis_url: str = Field(default="redis://localhost:6379", description="Redis URL for caching")
     cache_ttl: int = Field(default=300, description="Default cache TTL in seconds")
+    answer_cache_size: int = Field(default=256, description="Maximum answers kept in the in-process answer cache")
+    answer_cache_ttl: int = Field(default=60, description="Seconds an in-process cached answer stays valid")
     
     # Performance settings
     query_timeout: int = Field(default=30, description="Query timeout in seconds")
     max_result_rows: int = Field(default=1000, description="Maximum rows to return")
+    schema_token_budget: int = Field(default=6000, description="Approximate prompt tokens spent on table schemas")
+    
+    # Session settings
+    max_sessions: int = Field(default=1000, description="Maximum sessions holding a database connection")
+    session_ttl: int = Field(default=3600, description="Idle seconds before a session's connection is released")
+    session_verify_ttl: float = Field(default=5.0, description="Seconds a successful connection check is trusted")
+    
+    # Connection pool settings
+    pool_recycle: int = Field(default=1800, description="Maximum age in seconds of a reused database connection")
+    pool_idle_timeout: int = Field(default=300, description="Seconds an unused database connection is kept open")
+    pool_pre_ping: bool = Field(default=True, description="Check idle database connections before reuse")
+    pool_ping_interval: int = Field(default=60, description="Seconds between checks of idle database connections")
+    pool_prewarm: bool = Field(default=False, description="Open a connection to the default database on startup")
     
     # Nested configurations (initialized in __init__)
     database: Optional[DatabaseConfig] = None
@@ -182,6 +210,15 @@ class Config(BaseSettings):
             raise ValueError(f'Environment must be one of {allowed}, got: {v}')
         return v.lower()
     
+    @field_validator('tool_log_level')
+    @classmethod
+    def validate_tool_log_level(cls, v):
+        """Validate tool log level."""
+        allowed = ['info', 'warning', 'error']
+        if v.lower() not in allowed:
+            raise ValueError(f'Tool log level must be one of {allowed}, got: {v}')
+        return v.lower()
+    
     @field_validator('cache_ttl')
     @classmethod
     def validate_cache_ttl(cls, v):
@@ -190,6 +227,22 @@ class Config(BaseSettings):
             raise ValueError(f'Cache TTL must be between 1 and 86400 seconds, got: {v}')
         return v
     
+    @field_validator('answer_cache_size')
+    @classmethod
+    def validate_answer_cache_size(cls, v):
+        """Validate answer cache size (0 disables the cache)."""
+        if not 0 <= v <= 100000:
+            raise ValueError(f'Answer cache size must be between 0 and 100000, got: {v}')
+        return v
+    
+    @field_validator('answer_cache_ttl')
+    @classmethod
+    def validate_answer_cache_ttl(cls, v):
+        """Validate answer cache TTL."""
+        if not 1 <= v <= 86400:  # 1 second to 1 day
+            raise ValueError(f'Answer cache TTL must be between 1 and 86400 seconds, got: {v}')
+        return v
+    
     @field_validator('query_timeout')
     @classmethod
     def validate_query_timeout(cls, v):
@@ -206,6 +259,46 @@ class Config(BaseSettings):
             raise ValueError(f'Max result rows must be between 1 and 10000, got: {v}')
         return v
     
+    @field_validator('schema_token_budget')
+    @classmethod
+    def validate_schema_token_budget(cls, v):
+        """Validate schema token budget."""
+        if not 100 <= v <= 200000:
+            raise ValueError(f'Schema token budget must be between 100 and 200000, got: {v}')
+        return v
+    
+    @field_validator('max_sessions')
+    @classmethod
+    def validate_max_sessions(cls, v):
+        """Validate max sessions."""
+        if not 1 <= v <= 100000:
+            raise ValueError(f'Max sessions must be between 1 and 100000, got: {v}')
+        return v
+    
+    @field_validator('session_ttl')
+    @classmethod
+    def validate_session_ttl(cls, v):
+        """Validate session TTL."""
+        if not 1 <= v <= 604800:  # 1 second to 1 week
+            raise ValueError(f'Session TTL must be between 1 and 604800 seconds, got: {v}')
+        return v
+    
+    @field_validator('session_verify_ttl')
+    @classmethod
+    def validate_session_verify_ttl(cls, v):
+        """Validate session verification TTL (0 checks on every call)."""
+        if not 0 <= v <= 300:
+            raise ValueError(f'Session verify TTL must be between 0 and 300 seconds, got: {v}')
+        return v
+    
+    @field_validator('pool_recycle', 'pool_idle_timeout', 'pool_ping_interval')
+    @classmethod
+    def validate_pool_timing(cls, v, info):
+        """Validate connection pool durations."""
+        if not 1 <= v <= 86400:  # 1 second to 1 day
+            raise ValueError(f'{info.field_name} must be between 1 and 86400 seconds, got: {v}')
+        return v
+    
     model_config = ConfigDict(
         env_file=".env",
         case_sensitive=False,
@@ -184,6 +184,7 @@ class QueryExecutionError(NaturalSQLException):
                 suggestions.insert(0, "Database connection was lost during query execution")
         
         super().__init__(user_message, suggestions, technical_details)
+        self.sql_query = sql_query
 
 
 class ConfigurationError(NaturalSQLException):
@@ -0,0 +1,57 @@
+"""
+Buffered progress logging for MCP tools.
+
+Every ctx.info() or ctx.warning() call is sent to the client as its own log
+notification. Tools that report several progress steps per call collect
+them in a LogBuffer instead and send them together.
+"""
+
+from itertools import groupby
+from typing import Any, List, Tuple
+
+from .config import config
+
+
+_LEVELS = {"info": 20, "warning": 30, "error": 40}
+
+# Messages below this level are dropped without being formatted
+_MIN_LEVEL = _LEVELS[config.tool_log_level if config else "info"]
+
+
+class LogBuffer:
+    """
+    Collects a tool call's info and warning messages until flushed.
+
+    It has the same awaitable info() and warning() methods as the tool
+    context, so helpers can log through either one. Messages take
+    %-style arguments, which are only formatted when the message is sent,
+    and messages below the configured TOOL_LOG_LEVEL are dropped. Errors are
+    not buffered; flush the buffer and log them through the context directly.
+    """
+
+    def __init__(self, ctx: Any):
+        """
+        Initialize the buffer.
+
+        Args:
+            ctx: Tool context the messages are sent through
+        """
+        self.ctx = ctx
+        self._entries: List[Tuple[str, str, Tuple[Any, ...]]] = []
+
+    async def info(self, message: str, *args: Any) -> None:
+        """Buffer an info message, formatted with args when it is sent."""
+        if _MIN_LEVEL <= _LEVELS["info"]:
+            self._entries.append(("info", message, args))
+
+    async def warning(self, message: str, *args: Any) -> None:
+        """Buffer a warning message, formatted with args when it is sent."""
+        if _MIN_LEVEL <= _LEVELS["warning"]:
+            self._entries.append(("warning", message, args))
+
+    async def flush(self) -> None:
+        """Send the buffered messages, joining consecutive ones of the same level."""
+        entries, self._entries = self._entries, []
+        for level, group in groupby(entries, key=lambda entry: entry[0]):
+            text = "\n".join(message % args if args else message for _, message, args in group)
+            await getattr(self.ctx, level)(text)
@@ -0,0 +1,82 @@
+"""
+Session identity helpers for the Natural Language SQL MCP Server.
+
+This module resolves the session ID that scopes per-session state such as
+database connections and query history for the tool call being executed.
+"""
+
+import logging
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SESSION_ID = "default_session"
+
+# Set once the fallback session ID has been reported, so the warning fires only once
+_default_session_warned = False
+
+# Bound by the transport layer when a request is dispatched
+_current_session_id: ContextVar[Optional[str]] = ContextVar("current_session_id", default=None)
+
+
+def bind_session_id(session_id: str) -> Token:
+    """
+    Bind the session ID for the current request context.
+
+    Args:
+        session_id: Session identifier of the incoming request
+
+    Returns:
+        Token that can be passed to reset_session_id()
+    """
+    return _current_session_id.set(session_id)
+
+
+def reset_session_id(token: Token) -> None:
+    """Restore the session binding that was active before bind_session_id()."""
+    _current_session_id.reset(token)
+
+
+def get_session_id(ctx: Any) -> str:
+    """
+    Get the session ID for the current tool call.
+
+    Uses the ID bound for the request if there is one, and otherwise falls
+    back to the ``session_id`` attribute of the tool context, which is
+    looked up once per context.
+
+    Args:
+        ctx: Tool context of the current call
+
+    Returns:
+        Session identifier string
+    """
+    global _default_session_warned
+    
+    session_id = _current_session_id.get()
+    if session_id is not None:
+        return session_id
+    
+    # Remember the resolved ID on the context, which lives for one tool call
+    ctx_dict = getattr(ctx, '__dict__', None)
+    if ctx_dict is not None:
+        session_id = ctx_dict.get('_cached_session_id')
+        if session_id is not None:
+            return session_id
+    
+    session_id = getattr(ctx, 'session_id', None)
+    if session_id is None:
+        if not _default_session_warned:
+            _default_session_warned = True
+            logger.warning(
+                f"No session ID bound for tool call; using '{DEFAULT_SESSION_ID}'. "
+                "All such clients share one database connection and query history; "
+                "check that the transport binds a session ID per client."
+            )
+        session_id = DEFAULT_SESSION_ID
+    
+    if ctx_dict is not None:
+        ctx_dict['_cached_session_id'] = session_id
+    return session_id
@@ -7,7 +7,7 @@ functionality to enhance user experience and provide query suggestions.
 
 import uuid
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from collections import defaultdict
@@ -17,7 +17,7 @@ from .config import config
 from .exceptions import ValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryHistory:
     """Represents a single query in the user's history."""
     
@@ -31,16 +31,22 @@ class QueryHistory:
     database_type: str
     session_id: str
     error_message: Optional[str] = None
+    # ISO form of timestamp, formatted once when the entry is created
+    timestamp_iso: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.timestamp_iso = self.timestamp.isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
+        data['timestamp'] = data.pop('timestamp_iso')
         return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'QueryHistory':
         """Create from dictionary (for deserialization)."""
+        data.pop('timestamp_iso', None)
         data['timestamp'] = datetime.fromisoformat(data['timestamp'])
         return cls(**data)
     
@@ -132,12 +138,15 @@ class SessionManager:
         if not natural_query or not natural_query.strip():
             raise ValidationError("natural_query", "empty", "Query cannot be empty")
         
+        # One clock read serves as both the entry timestamp and the activity time
+        now = datetime.now()
+        
         # Create history entry
         history_entry = QueryHistory(
             id=str(uuid.uuid4()),
             query=natural_query.strip(),
             sql=sql_query.strip() if sql_query else "",
-            timestamp=datetime.now(),
+            timestamp=now,
             results_count=results_count,
             execution_time=execution_time,
             success=success,
@@ -160,7 +169,7 @@ class SessionManager:
         await self._update_session_stats(session_id, history_entry)
         
         # Update last activity
-        self._session_last_activity[session_id] = datetime.now()
+        self._session_last_activity[session_id] = now
         
         return history_entry
     
@@ -313,9 +322,14 @@ class SessionManager:
                 "Which products are selling the most?"
             ])
         
-        # Remove duplicates and limit
-        suggestions = list(dict.fromkeys(suggestions))  # Remove duplicates
-        return suggestions[:5]
+        # Remove duplicates, stopping as soon as the limit is reached
+        unique_suggestions = {}
+        for suggestion in suggestions:
+            if suggestion not in unique_suggestions:
+                unique_suggestions[suggestion] = None
+                if len(unique_suggestions) == 5:
+                    break
+        return list(unique_suggestions)
     
     async def get_session_stats(self, session_id: str) -> SessionStats:
         """
@@ -346,11 +360,23 @@ class SessionManager:
                 sessions_to_remove.append(session_id)
         
         for session_id in sessions_to_remove:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-            if session_id in self._session_stats:
-                del self._session_stats[session_id]
-            del self._session_last_activity[session_id]
+            await self.clear_session(session_id)
+    
+    async def clear_session(self, session_id: str) -> bool:
+        """
+        Remove a session's history, statistics and activity record.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            True if the session had any stored state
+        """
+        # No await between the pops, so other tasks never see a partly cleared session
+        history = self._sessions.pop(session_id, None)
+        stats = self._session_stats.pop(session_id, None)
+        last_activity = self._session_last_activity.pop(session_id, None)
+        return history is not None or stats is not None or last_activity is not None
     
     async def export_session_history(self, session_id: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,76 @@
+"""
+Shared error handling for MCP tools.
+
+This module provides a decorator that turns exceptions raised by a tool into
+the structured error responses returned to MCP clients.
+"""
+
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .config import config
+from .exceptions import NaturalSQLException, DatabaseConnectionError, ConfigurationError
+
+
+def tool_error_handler(
+    log_message: str,
+    status_key: str = "success",
+    default_db_type: str = "unknown",
+    unexpected_log_message: Optional[str] = None,
+    user_message: Optional[str] = None,
+    suggestions: Optional[List[str]] = None
+) -> Callable:
+    """
+    Convert exceptions raised by a tool into error responses.
+    
+    Known NaturalSQLException errors are returned as they are. Any other
+    exception is wrapped in a DatabaseConnectionError. In both cases the
+    error is logged through the tool context, configuration errors with
+    the "Configuration error" prefix.
+    
+    Args:
+        log_message: Prefix of the message logged via ctx.error
+        status_key: Response key set to False on failure ("success" or "connected")
+        default_db_type: Database type reported for unexpected errors when the
+            call did not pass a db_type argument
+        unexpected_log_message: Optional prefix logged for unexpected errors
+            instead of log_message
+        user_message: Optional user message for unexpected errors
+        suggestions: Optional suggestions for unexpected errors
+    
+    Returns:
+        Decorator for async tool functions taking ctx as first argument
+    """
+    def decorator(func: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        async def wrapper(ctx, *args, **kwargs) -> Dict[str, Any]:
+            try:
+                return await func(ctx, *args, **kwargs)
+            except NaturalSQLException as e:
+                error = e
+                prefix = "Configuration error" if isinstance(e, ConfigurationError) else log_message
+            except Exception as e:
+                # Report the database type the call resolved to, however it was passed
+                arguments = signature.bind_partial(ctx, *args, **kwargs).arguments
+                error = DatabaseConnectionError(
+                    db_type=arguments.get('db_type') or default_db_type,
+                    technical_details=str(e)
+                )
+                if user_message:
+                    error.user_message = user_message
+                if suggestions:
+                    error.suggestions = list(suggestions)
+                prefix = unexpected_log_message or log_message
+            
+            await ctx.error(f"{prefix}: {error.user_message}")
+            return {
+                status_key: False,
+                "error": error.to_dict(include_technical=config.debug if config else False)
+            }
+        
+        return wrapper
+    
+    return decorator
@@ -5,9 +5,18 @@ This module defines the abstract interface that all database managers must imple
 It provides a consistent API for interacting with different SQL databases.
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of table schemas fetched at once by the default get_schemas_bulk()
+SCHEMA_FETCH_CONCURRENCY = 8
 
 
 @dataclass
@@ -17,6 +26,11 @@ class TableSchema:
     columns: List[Dict[str, Any]]  # List of column info dicts
     primary_keys: List[str]
     foreign_keys: List[Dict[str, str]]  # List of foreign key relationships
+    
+    def fingerprint(self) -> str:
+        """Get a digest that changes whenever the table's structure changes."""
+        serialized = json.dumps(asdict(self), sort_keys=True, default=str)
+        return hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
 
 
 @dataclass
@@ -31,6 +45,12 @@ class QueryResult:
 class BaseManager(ABC):
     """Abstract base class for all database managers."""
     
+    # SQL dialect of the database, passed to the translator
+    db_type = "unknown"
+    
+    # Managers are looked up on every tool call; slots keep attribute access cheap
+    __slots__ = ('connection_config', 'connection', 'is_connected', '__weakref__')
+    
     def __init__(self, connection_config: Dict[str, Any]):
         """
         Initialize the database manager with connection configuration.
@@ -58,13 +78,22 @@ class BaseManager(ABC):
         pass
     
     @abstractmethod
-    async def execute_query(self, query: str, parameters: Optional[List[Any]] = None) -> QueryResult:
+    async def execute_query(
+        self,
+        query: str,
+        parameters: Optional[List[Any]] = None,
+        max_rows: Optional[int] = None
+    ) -> QueryResult:
         """
         Execute a SQL query against the database.
         
         Args:
             query: The SQL query string
             parameters: Optional list of parameters for the query
+            max_rows: Optional maximum number of rows to fetch for a SELECT;
+                later rows are not built into the result, though some drivers
+                still receive and discard them, so callers should also LIMIT
+                the query
             
         Returns:
             QueryResult containing the results or error information
@@ -81,6 +110,18 @@ class BaseManager(ABC):
         """
         pass
     
+    async def get_schema_version(self) -> Optional[Any]:
+        """
+        Get a cheap token that changes whenever the database schema changes.
+        
+        Callers can reuse introspected schemas for as long as the token stays
+        the same. Managers that cannot detect schema changes return None.
+        
+        Returns:
+            Hashable schema version token, or None if unavailable
+        """
+        return None
+    
     @abstractmethod
     async def get_table_schema(self, table_name: str) -> TableSchema:
         """
@@ -94,6 +135,42 @@ class BaseManager(ABC):
         """
         pass
     
+    async def get_schemas_bulk(self, table_names: List[str]) -> List[TableSchema]:
+        """
+        Get the schema information for several tables at once.
+        
+        The default implementation fetches each table's schema concurrently;
+        managers override it to read all tables with one catalog query.
+        
+        Args:
+            table_names: Names of the tables
+            
+        Returns:
+            TableSchema objects in the order of table_names, omitting tables
+            without columns
+            
+        Raises:
+            Exception: The first error raised while reading a table's schema
+        """
+        semaphore = asyncio.Semaphore(SCHEMA_FETCH_CONCURRENCY)
+        
+        async def fetch_schema(table_name: str) -> TableSchema:
+            async with semaphore:
+                return await self.get_table_schema(table_name)
+        
+        results = await asyncio.gather(
+            *(fetch_schema(name) for name in table_names),
+            return_exceptions=True
+        )
+        
+        # Callers cache the tables left out as having no columns, so never leave out a failed one
+        for table_name, result in zip(table_names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to get schema for table {table_name}: {str(result)}")
+                raise result
+        
+        return [result for result in results if result.columns]
+    
     @abstractmethod
     async def test_connection(self) -> bool:
         """
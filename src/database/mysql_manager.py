@@ -6,6 +6,7 @@ using the aiomysql library for async database operations.
 """
 
 import aiomysql
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from .base_manager import BaseManager, TableSchema, QueryResult
@@ -17,6 +18,10 @@ logger = logging.getLogger(__name__)
 class MySQLManager(BaseManager):
     """MySQL database manager using aiomysql."""
     
+    db_type = "mysql"
+    
+    __slots__ = ('connection_pool',)
+    
     def __init__(self, connection_config: Dict[str, Any]):
         """
         Initialize MySQL manager.
@@ -74,13 +79,19 @@ class MySQLManager(BaseManager):
         except Exception as e:
             logger.error(f"Error disconnecting from MySQL: {str(e)}")
     
-    async def execute_query(self, query: str, parameters: Optional[List[Any]] = None) -> QueryResult:
+    async def execute_query(
+        self,
+        query: str,
+        parameters: Optional[List[Any]] = None,
+        max_rows: Optional[int] = None
+    ) -> QueryResult:
         """
         Execute a SQL query against MySQL.
         
         Args:
             query: The SQL query string
             parameters: Optional list of parameters for the query
+            max_rows: Optional maximum number of rows to fetch for a SELECT
             
         Returns:
             QueryResult containing the results or error information
@@ -95,7 +106,10 @@ class MySQLManager(BaseManager):
         
         try:
             async with self.connection_pool.acquire() as conn:
-                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                # An unbuffered cursor decodes only the rows fetched from it; closing
+                # it still reads and discards the rest of the result from the server
+                cursor_class = aiomysql.SSDictCursor if max_rows is not None else aiomysql.DictCursor
+                async with conn.cursor(cursor_class) as cursor:
                     if parameters:
                         await cursor.execute(query, parameters)
                     else:
@@ -103,16 +117,22 @@ class MySQLManager(BaseManager):
                     
                     # Fetch all results for SELECT queries
                     if query.strip().upper().startswith('SELECT'):
-                        result = await cursor.fetchall()
+                        if max_rows is not None:
+                            result = await cursor.fetchmany(max_rows)
+                        else:
+                            result = await cursor.fetchall()
                         data = list(result) if result else []
+                        # An unbuffered cursor's rowcount is not a row count (2**64 - 1)
+                        row_count = len(data)
                     else:
                         # For INSERT/UPDATE/DELETE, return affected rows
                         data = []
+                        row_count = cursor.rowcount
                         
                     return QueryResult(
                         success=True,
                         data=data,
-                        row_count=len(data) if data else cursor.rowcount
+                        row_count=row_count
                     )
                 
         except Exception as e:
@@ -145,6 +165,40 @@ class MySQLManager(BaseManager):
             logger.error(f"Failed to get tables: {result.error_message}")
             return []
     
+    async def get_schema_version(self) -> Optional[Any]:
+        """
+        Get a token that changes whenever the database's tables or columns change.
+        
+        Counts alone miss renamed columns and in-place type or nullability
+        changes, so the token includes a checksum of every column's and key
+        column's definition: the XOR of a 64-bit MD5 prefix per row.
+        
+        Returns:
+            Schema version token, or None if it could not be read
+        """
+        query = """
+        SELECT
+            COUNT(*) AS table_count,
+            MAX(create_time) AS last_created,
+            (SELECT CONCAT(COUNT(*), ':', BIT_XOR(CAST(CONV(LEFT(MD5(CONCAT_WS(',',
+                    table_name, column_name, ordinal_position, column_type, is_nullable, column_key
+                )), 16), 16, 10) AS UNSIGNED)))
+             FROM information_schema.columns WHERE table_schema = %s) AS column_checksum,
+            (SELECT CONCAT(COUNT(*), ':', BIT_XOR(CAST(CONV(LEFT(MD5(CONCAT_WS(',',
+                    table_name, constraint_name, column_name, ordinal_position,
+                    referenced_table_name, referenced_column_name
+                )), 16), 16, 10) AS UNSIGNED)))
+             FROM information_schema.key_column_usage WHERE table_schema = %s) AS key_checksum
+        FROM information_schema.tables
+        WHERE table_schema = %s;
+        """
+        
+        database = self.connection_config['database']
+        result = await self.execute_query(query, [database, database, database])
+        if result.success and result.data:
+            return tuple(result.data[0].values())
+        return None
+    
     async def get_table_schema(self, table_name: str) -> TableSchema:
         """
         Get the schema information for a specific table.
@@ -178,7 +232,8 @@ class MySQLManager(BaseManager):
         FROM information_schema.key_column_usage
         WHERE table_schema = %s 
         AND table_name = %s 
-        AND constraint_name = 'PRIMARY';
+        AND constraint_name = 'PRIMARY'
+        ORDER BY ordinal_position;
         """
         
         # Query for foreign keys
@@ -190,7 +245,8 @@ class MySQLManager(BaseManager):
         FROM information_schema.key_column_usage kcu
         WHERE kcu.table_schema = %s 
         AND kcu.table_name = %s 
-        AND kcu.referenced_table_name IS NOT NULL;
+        AND kcu.referenced_table_name IS NOT NULL
+        ORDER BY kcu.constraint_name, kcu.ordinal_position;
         """
         
         try:
@@ -233,6 +289,97 @@ class MySQLManager(BaseManager):
                 foreign_keys=[]
             )
     
+    async def get_schemas_bulk(self, table_names: List[str]) -> List[TableSchema]:
+        """
+        Get the schema information for several tables with one query per catalog.
+        
+        Args:
+            table_names: Names of the tables
+            
+        Returns:
+            TableSchema objects in the order of table_names, omitting tables
+            the catalog lists no columns for
+            
+        Raises:
+            RuntimeError: If a catalog query fails
+        """
+        names = list(table_names)
+        if not names:
+            return []
+        placeholders = ", ".join(["%s"] * len(names))
+        
+        columns_query = f"""
+        SELECT 
+            table_name,
+            column_name,
+            data_type,
+            is_nullable,
+            column_default,
+            character_maximum_length,
+            numeric_precision,
+            numeric_scale,
+            column_key,
+            extra
+        FROM information_schema.columns 
+        WHERE table_schema = %s AND table_name IN ({placeholders})
+        ORDER BY table_name, ordinal_position;
+        """
+        
+        pk_query = f"""
+        SELECT table_name, column_name
+        FROM information_schema.key_column_usage
+        WHERE table_schema = %s 
+        AND table_name IN ({placeholders}) 
+        AND constraint_name = 'PRIMARY'
+        ORDER BY table_name, ordinal_position;
+        """
+        
+        fk_query = f"""
+        SELECT 
+            kcu.table_name,
+            kcu.column_name,
+            kcu.referenced_table_name AS foreign_table_name,
+            kcu.referenced_column_name AS foreign_column_name
+        FROM information_schema.key_column_usage kcu
+        WHERE kcu.table_schema = %s 
+        AND kcu.table_name IN ({placeholders}) 
+        AND kcu.referenced_table_name IS NOT NULL
+        ORDER BY kcu.table_name, kcu.constraint_name, kcu.ordinal_position;
+        """
+        
+        parameters = [self.connection_config['database'], *names]
+        columns_result, pk_result, fk_result = await asyncio.gather(
+            self.execute_query(columns_query, parameters),
+            self.execute_query(pk_query, parameters),
+            self.execute_query(fk_query, parameters)
+        )
+        
+        # A partial read would be cached as the tables' schema, so fail the whole batch
+        for result in (columns_result, pk_result, fk_result):
+            if not result.success:
+                raise RuntimeError(f"Failed to read table schemas: {result.error_message}")
+        
+        schemas = {
+            name: TableSchema(table_name=name, columns=[], primary_keys=[], foreign_keys=[])
+            for name in names
+        }
+        
+        for row in columns_result.data:
+            schemas[row.pop('table_name')].columns.append(row)
+        
+        for row in pk_result.data:
+            schemas[row['table_name']].primary_keys.append(row['column_name'])
+        
+        for row in fk_result.data:
+            schemas[row['table_name']].foreign_keys.append({
+                'column': row['column_name'],
+                'foreign_table': row['foreign_table_name'],
+                'foreign_column': row['foreign_column_name']
+            })
+        
+        # Tables the catalog returned no columns for are missing or not accessible
+        return [schema for schema in schemas.values() if schema.columns]
+    
     async def test_connection(self) -> bool:
         """
         Test if the database connection is working.
@@ -6,6 +6,7 @@ using the asyncpg library for async database operations.
 """
 
 import asyncpg
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from .base_manager import BaseManager, TableSchema, QueryResult
@@ -17,12 +18,17 @@ logger = logging.getLogger(__name__)
 class PostgresManager(BaseManager):
     """PostgreSQL database manager using asyncpg."""
     
+    db_type = "postgresql"
+    
+    __slots__ = ('connection_pool',)
+    
     def __init__(self, connection_config: Dict[str, Any]):
         """
         Initialize PostgreSQL manager.
         
         Args:
-            connection_config: Dict with keys: host, port, username, password, database
+            connection_config: Dict with keys: host, port, username, password, database,
+                and optionally statement_cache_size
         """
         super().__init__(connection_config)
         self.connection_pool = None
@@ -46,7 +52,9 @@ class PostgresManager(BaseManager):
                 min_size=1,
                 max_size=5,
                 command_timeout=30,
-                statement_cache_size=0  # Disable prepared statements for pgbouncer compatibility
+                # asyncpg caches prepared statements per connection by SQL text, so
+                # repeated queries skip parsing and planning; 0 keeps pgbouncer working
+                statement_cache_size=self.connection_config.get('statement_cache_size', 0)
             )
             
             # Test the connection
@@ -73,13 +81,19 @@ class PostgresManager(BaseManager):
         except Exception as e:
             logger.error(f"Error disconnecting from PostgreSQL: {str(e)}")
     
-    async def execute_query(self, query: str, parameters: Optional[List[Any]] = None) -> QueryResult:
+    async def execute_query(
+        self,
+        query: str,
+        parameters: Optional[List[Any]] = None,
+        max_rows: Optional[int] = None
+    ) -> QueryResult:
         """
         Execute a SQL query against PostgreSQL.
         
         Args:
             query: The SQL query string
             parameters: Optional list of parameters for the query
+            max_rows: Optional maximum number of rows to fetch for a SELECT
             
         Returns:
             QueryResult containing the results or error information
@@ -94,7 +108,12 @@ class PostgresManager(BaseManager):
         
         try:
             async with self.connection_pool.acquire() as conn:
-                if parameters:
+                if max_rows is not None:
+                    # Read through a server-side cursor so extra rows stay on the server
+                    async with conn.transaction(readonly=True):
+                        cursor = await conn.cursor(query, *(parameters or []))
+                        result = await cursor.fetch(max_rows)
+                elif parameters:
                     result = await conn.fetch(query, *parameters)
                 else:
                     result = await conn.fetch(query)
@@ -138,6 +157,33 @@ class PostgresManager(BaseManager):
             logger.error(f"Failed to get tables: {result.error_message}")
             return []
     
+    async def get_schema_version(self) -> Optional[Any]:
+        """
+        Get a token that changes whenever the public schema changes.
+        
+        Any DDL writes new rows to pg_class, pg_attribute or pg_constraint,
+        so their row counts and newest xmin together identify the schema.
+        
+        Returns:
+            Schema version token, or None if it could not be read
+        """
+        query = """
+        SELECT
+            (SELECT count(*) FROM pg_class WHERE relnamespace = 'public'::regnamespace) AS relations,
+            (SELECT max(xmin::text::bigint) FROM pg_class WHERE relnamespace = 'public'::regnamespace) AS relations_xmin,
+            (SELECT count(*) FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid
+             WHERE c.relnamespace = 'public'::regnamespace) AS columns,
+            (SELECT max(a.xmin::text::bigint) FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid
+             WHERE c.relnamespace = 'public'::regnamespace) AS columns_xmin,
+            (SELECT count(*) FROM pg_constraint WHERE connamespace = 'public'::regnamespace) AS constraints,
+            (SELECT max(xmin::text::bigint) FROM pg_constraint WHERE connamespace = 'public'::regnamespace) AS constraints_xmin;
+        """
+        
+        result = await self.execute_query(query)
+        if result.success and result.data:
+            return tuple(result.data[0].values())
+        return None
+    
     async def get_table_schema(self, table_name: str) -> TableSchema:
         """
         Get the schema information for a specific table.
@@ -171,7 +217,8 @@ class PostgresManager(BaseManager):
         ON tc.constraint_name = kcu.constraint_name
         WHERE tc.table_schema = 'public' 
         AND tc.table_name = $1 
-        AND tc.constraint_type = 'PRIMARY KEY';
+        AND tc.constraint_type = 'PRIMARY KEY'
+        ORDER BY kcu.ordinal_position;
         """
         
         # Query for foreign keys
@@ -187,7 +234,8 @@ class PostgresManager(BaseManager):
         ON tc.constraint_name = ccu.constraint_name
         WHERE tc.table_schema = 'public' 
         AND tc.table_name = $1 
-        AND tc.constraint_type = 'FOREIGN KEY';
+        AND tc.constraint_type = 'FOREIGN KEY'
+        ORDER BY tc.constraint_name, kcu.ordinal_position;
         """
         
         try:
@@ -228,6 +276,96 @@ class PostgresManager(BaseManager):
                 foreign_keys=[]
             )
     
+    async def get_schemas_bulk(self, table_names: List[str]) -> List[TableSchema]:
+        """
+        Get the schema information for several tables with one query per catalog.
+        
+        Args:
+            table_names: Names of the tables
+            
+        Returns:
+            TableSchema objects in the order of table_names, omitting tables
+            the catalog lists no columns for
+            
+        Raises:
+            RuntimeError: If a catalog query fails
+        """
+        columns_query = """
+        SELECT 
+            table_name,
+            column_name,
+            data_type,
+            is_nullable,
+            column_default,
+            character_maximum_length,
+            numeric_precision,
+            numeric_scale
+        FROM information_schema.columns 
+        WHERE table_schema = 'public' AND table_name = ANY($1::text[])
+        ORDER BY table_name, ordinal_position;
+        """
+        
+        pk_query = """
+        SELECT tc.table_name, kcu.column_name
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage kcu 
+        ON tc.constraint_name = kcu.constraint_name
+        WHERE tc.table_schema = 'public' 
+        AND tc.table_name = ANY($1::text[]) 
+        AND tc.constraint_type = 'PRIMARY KEY'
+        ORDER BY tc.table_name, kcu.ordinal_position;
+        """
+        
+        fk_query = """
+        SELECT 
+            tc.table_name,
+            kcu.column_name,
+            ccu.table_name AS foreign_table_name,
+            ccu.column_name AS foreign_column_name
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage kcu 
+        ON tc.constraint_name = kcu.constraint_name
+        JOIN information_schema.constraint_column_usage ccu 
+        ON tc.constraint_name = ccu.constraint_name
+        WHERE tc.table_schema = 'public' 
+        AND tc.table_name = ANY($1::text[]) 
+        AND tc.constraint_type = 'FOREIGN KEY'
+        ORDER BY tc.table_name, tc.constraint_name, kcu.ordinal_position;
+        """
+        
+        names = list(table_names)
+        columns_result, pk_result, fk_result = await asyncio.gather(
+            self.execute_query(columns_query, [names]),
+            self.execute_query(pk_query, [names]),
+            self.execute_query(fk_query, [names])
+        )
+        
+        # A partial read would be cached as the tables' schema, so fail the whole batch
+        for result in (columns_result, pk_result, fk_result):
+            if not result.success:
+                raise RuntimeError(f"Failed to read table schemas: {result.error_message}")
+        
+        schemas = {
+            name: TableSchema(table_name=name, columns=[], primary_keys=[], foreign_keys=[])
+            for name in names
+        }
+        
+        for row in columns_result.data:
+            schemas[row.pop('table_name')].columns.append(row)
+        
+        for row in pk_result.data:
+            schemas[row['table_name']].primary_keys.append(row['column_name'])
+        
+        for row in fk_result.data:
+            schemas[row['table_name']].foreign_keys.append({
+                'column': row['column_name'],
+                'foreign_table': row['foreign_table_name'],
+                'foreign_column': row['foreign_column_name']
+            })
+        
+        # Tables the catalog returned no columns for are missing or not accessible
+        return [schema for schema in schemas.values() if schema.columns]
+    
     async def test_connection(self) -> bool:
         """
         Test if the database connection is working.
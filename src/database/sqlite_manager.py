@@ -17,6 +17,10 @@ logger = logging.getLogger(__name__)
 class SQLiteManager(BaseManager):
     """SQLite database manager using aiosqlite."""
     
+    db_type = "sqlite"
+    
+    __slots__ = ()
+    
     def __init__(self, connection_config: Dict[str, Any]):
         """
         Initialize SQLite manager.
@@ -65,13 +69,19 @@ class SQLiteManager(BaseManager):
         except Exception as e:
             logger.error(f"Error disconnecting from SQLite: {str(e)}")
     
-    async def execute_query(self, query: str, parameters: Optional[List[Any]] = None) -> QueryResult:
+    async def execute_query(
+        self,
+        query: str,
+        parameters: Optional[List[Any]] = None,
+        max_rows: Optional[int] = None
+    ) -> QueryResult:
         """
         Execute a SQL query against SQLite.
         
         Args:
             query: The SQL query string
             parameters: Optional list of parameters for the query
+            max_rows: Optional maximum number of rows to fetch for a SELECT
             
         Returns:
             QueryResult containing the results or error information
@@ -91,7 +101,7 @@ class SQLiteManager(BaseManager):
             if parameters:
                 async with self.connection.execute(query, parameters) as cursor:
                     if query.strip().upper().startswith('SELECT'):
-                        rows = await cursor.fetchall()
+                        rows = await (cursor.fetchmany(max_rows) if max_rows is not None else cursor.fetchall())
                         data = [dict(row) for row in rows] if rows else []
                         row_count = len(data)
                     else:
@@ -100,7 +110,7 @@ class SQLiteManager(BaseManager):
             else:
                 async with self.connection.execute(query) as cursor:
                     if query.strip().upper().startswith('SELECT'):
-                        rows = await cursor.fetchall()
+                        rows = await (cursor.fetchmany(max_rows) if max_rows is not None else cursor.fetchall())
                         data = [dict(row) for row in rows] if rows else []
                         row_count = len(data)
                     else:
@@ -147,6 +157,18 @@ class SQLiteManager(BaseManager):
             logger.error(f"Failed to get tables: {result.error_message}")
             return []
     
+    async def get_schema_version(self) -> Optional[Any]:
+        """
+        Get SQLite's schema cookie, which is incremented on every schema change.
+        
+        Returns:
+            Schema version number, or None if it could not be read
+        """
+        result = await self.execute_query("SELECT schema_version FROM pragma_schema_version;")
+        if result.success and result.data:
+            return result.data[0]['schema_version']
+        return None
+    
     async def get_table_schema(self, table_name: str) -> TableSchema:
         """
         Get the schema information for a specific table.
@@ -213,6 +235,81 @@ class SQLiteManager(BaseManager):
                 foreign_keys=[]
             )
     
+    async def get_schemas_bulk(self, table_names: List[str]) -> List[TableSchema]:
+        """
+        Get the schema information for several tables with one query per pragma.
+        
+        Uses the table-valued pragma functions so all tables are read in a
+        single SELECT each for columns and foreign keys.
+        
+        Args:
+            table_names: Names of the tables
+            
+        Returns:
+            TableSchema objects in the order of table_names, omitting tables
+            the catalog lists no columns for
+            
+        Raises:
+            RuntimeError: If a catalog query fails
+        """
+        names = list(table_names)
+        if not names:
+            return []
+        placeholders = ", ".join(["?"] * len(names))
+        
+        columns_query = f"""
+        SELECT m.name AS table_name, p.name, p.type, p."notnull", p.dflt_value, p.pk
+        FROM sqlite_master m
+        JOIN pragma_table_info(m.name) p
+        WHERE m.type = 'table' AND m.name IN ({placeholders})
+        ORDER BY m.name, p.cid;
+        """
+        
+        fk_query = f"""
+        SELECT m.name AS table_name, f."from", f."table", f."to"
+        FROM sqlite_master m
+        JOIN pragma_foreign_key_list(m.name) f
+        WHERE m.type = 'table' AND m.name IN ({placeholders})
+        ORDER BY m.name, f.id, f.seq;
+        """
+        
+        schemas = {
+            name: TableSchema(table_name=name, columns=[], primary_keys=[], foreign_keys=[])
+            for name in names
+        }
+        
+        # A single aiosqlite connection runs one statement at a time, so run them in turn
+        columns_result = await self.execute_query(columns_query, names)
+        if not columns_result.success:
+            raise RuntimeError(f"Failed to read table schemas: {columns_result.error_message}")
+        fk_result = await self.execute_query(fk_query, names)
+        if not fk_result.success:
+            raise RuntimeError(f"Failed to read table schemas: {fk_result.error_message}")
+        
+        for row in columns_result.data:
+            schema = schemas[row['table_name']]
+            schema.columns.append({
+                'column_name': row['name'],
+                'data_type': row['type'],
+                'is_nullable': 'NO' if row['notnull'] else 'YES',
+                'column_default': row['dflt_value'],
+                'character_maximum_length': None,
+                'numeric_precision': None,
+                'numeric_scale': None
+            })
+            if row['pk']:
+                schema.primary_keys.append(row['name'])
+        
+        for row in fk_result.data:
+            schemas[row['table_name']].foreign_keys.append({
+                'column': row['from'],
+                'foreign_table': row['table'],
+                'foreign_column': row['to']
+            })
+        
+        # Tables the catalog returned no columns for are missing or not accessible
+        return [schema for schema in schemas.values() if schema.columns]
+    
     async def test_connection(self) -> bool:
         """
         Test if the database connection is working.
@@ -3,7 +3,7 @@ Clean HTTP wrapper for the Natural Language SQL MCP Server.
 Only includes the endpoints actually used by the frontend.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
@@ -18,8 +18,14 @@ import urllib.parse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import only the tools we actually use
-from src.tools.connection import connect_database, get_connection_status
+from src.tools.connection import (
+    connect_database, get_connection_status, close_all_connections, prewarm_default_connection
+)
 from src.tools.query import query_data
+from src.nlp.translator import close_translator
+from src.core.session import bind_session_id, reset_session_id
+
+HTTP_SESSION_ID = "http_session"
 
 # Request/Response models
 class QueryRequest(BaseModel):
@@ -30,7 +36,7 @@ class DatabaseConnectionRequest(BaseModel):
     database_type: str = "auto"
 
 class MockContext:
-    def __init__(self, session_id: str = "http_session"):
+    def __init__(self, session_id: str = HTTP_SESSION_ID):
         self.session_id = session_id
 
     async def info(self, message: str):
@@ -53,10 +59,14 @@ async def lifespan(app: FastAPI):
     print("✅ CORS middleware configured")
     print("✅ Essential endpoints only")
     print("📖 API Documentation available at: /docs")
+    if await prewarm_default_connection():
+        print("✅ Default database connection prewarmed")
     print("=" * 60)
     yield
     # Shutdown
     print("👋 Shutting down HTTP API server")
+    await close_all_connections()
+    await close_translator()
 
 app = FastAPI(
     title="Natural Language SQL API",
@@ -76,6 +86,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def bind_request_session(request: Request, call_next):
+    # Resolve the session once per request; tools read it via get_session_id()
+    token = bind_session_id(HTTP_SESSION_ID)
+    try:
+        return await call_next(request)
+    finally:
+        reset_session_id(token)
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "version": "2.0.0", "service": "Natural Language SQL API"}
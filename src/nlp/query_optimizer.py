@@ -15,6 +15,28 @@ from ..database.base_manager import TableSchema
 from ..core.exceptions import QueryExecutionError, ValidationError
 
 
+_IN_SUBQUERY_PATTERN = re.compile(r'IN\s*\(\s*SELECT')
+_LEADING_WILDCARD_PATTERN = re.compile(r'LIKE\s+\'%.*%\'')
+
+# (predicate, message) pairs evaluated against the upper-cased SQL and its complexity score
+_WARNING_RULES = (
+    (lambda sql, score: score > 6,
+     "Query has high complexity - consider optimization or breaking into smaller queries"),
+    (lambda sql, score: 'SELECT *' in sql,
+     "Avoid SELECT * - specify only needed columns for better performance"),
+    (lambda sql, score: 'FULL JOIN' in sql or 'CROSS JOIN' in sql,
+     "Full and cross joins can be very expensive - ensure they are necessary"),
+    (lambda sql, score: _IN_SUBQUERY_PATTERN.search(sql) is not None,
+     "Consider using EXISTS instead of IN with subqueries for better performance"),
+    (lambda sql, score: sql.count('OR') > 3,
+     "Multiple OR conditions can slow down queries - consider using UNION or restructuring"),
+    (lambda sql, score: 'HAVING' in sql and 'WHERE' not in sql,
+     "Consider filtering with WHERE before grouping rather than using only HAVING"),
+    (lambda sql, score: _LEADING_WILDCARD_PATTERN.search(sql) is not None,
+     "Leading wildcard in LIKE pattern prevents index usage"),
+)
+
+
 class QueryComplexity(Enum):
     """Enum for query complexity levels."""
     LOW = "low"
@@ -216,30 +238,11 @@ class QueryOptimizer:
     
     def _generate_warnings(self, sql: str, complexity_score: int) -> List[str]:
         """Generate performance warnings for the query."""
-        warnings = []
-        
-        if complexity_score > 6:
-            warnings.append("Query has high complexity - consider optimization or breaking into smaller queries")
-        
-        if 'SELECT *' in sql:
-            warnings.append("Avoid SELECT * - specify only needed columns for better performance")
-        
-        if 'FULL JOIN' in sql or 'CROSS JOIN' in sql:
-            warnings.append("Full and cross joins can be very expensive - ensure they are necessary")
-        
-        if re.search(r'IN\s*\(\s*SELECT', sql):
-            warnings.append("Consider using EXISTS instead of IN with subqueries for better performance")
-        
-        if sql.count('OR') > 3:
-            warnings.append("Multiple OR conditions can slow down queries - consider using UNION or restructuring")
-        
-        if 'HAVING' in sql and 'WHERE' not in sql:
-            warnings.append("Consider filtering with WHERE before grouping rather than using only HAVING")
-        
-        if re.search(r'LIKE\s+\'%.*%\'', sql):
-            warnings.append("Leading wildcard in LIKE pattern prevents index usage")
-        
-        return warnings
+        return [
+            message
+            for predicate, message in _WARNING_RULES
+            if predicate(sql, complexity_score)
+        ]
     
     def _generate_optimizations(self, sql: str, schemas: List[TableSchema] = None) -> List[OptimizationSuggestion]:
         """Generate specific optimization suggestions."""
@@ -5,9 +5,12 @@ This module provides functionality to translate natural language queries
 into SQL statements using Large Language Models.
 """
 
+import importlib.util
 import logging
 import re
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import httpx
 from openai import AsyncOpenAI
 
 from ..core.config import config
@@ -17,6 +20,66 @@ from ..database.base_manager import TableSchema
 logger = logging.getLogger(__name__)
 
 
+# Kept free of per-request values so it forms a stable, cacheable prompt prefix
+_SYSTEM_INSTRUCTIONS = """You are an expert SQL translator.
+Your task is to convert natural language queries into valid SQL statements
+of the requested statement type, for the database type and schema given below.
+
+Guidelines:
+1. Generate only valid SQL syntax for the given database type
+2. Use appropriate table and column names from the schema
+3. For the requested statement type, ensure proper syntax and safety measures
+4. Do not include explanations, only return the SQL statement
+5. Use double quotes for identifiers if needed
+6. Be precise with data types and constraints
+"""
+
+# Number of rendered schema blocks kept per translator
+_SCHEMA_BLOCK_CACHE_SIZE = 32
+
+# HTTP/2 to the LLM API needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connections kept open between LLM calls, so later calls skip the TCP/TLS handshake
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# String literals, quoted identifiers and comments, blanked out before the
+# safety checks so their contents cannot trigger or hide a match
+_SQL_LITERAL_PATTERN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|--[^\n]*|/\*.*?\*/",
+    re.DOTALL
+)
+
+# The same for MySQL, whose quoted strings also take backslash escapes
+_MYSQL_LITERAL_PATTERN = re.compile(
+    r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"|`[^`]*`|(?:--|#)[^\n]*|/\*.*?\*/",
+    re.DOTALL
+)
+
+# Schema and privilege changes starting a statement or subquery; as plain
+# words such as a "grant" column they are allowed
+_DISALLOWED_KEYWORD_PATTERN = re.compile(
+    r'(?:^|[(;])\s*(DROP|TRUNCATE|ALTER|CREATE|GRANT|REVOKE|RENAME)\b',
+    re.IGNORECASE
+)
+
+
+def blank_sql_literals(sql: str, database_type: str = "postgresql") -> str:
+    """
+    Replace the string literals, quoted identifiers and comments in SQL with spaces.
+    
+    Args:
+        sql: SQL text
+        database_type: Type of database, which decides how quotes are escaped
+        
+    Returns:
+        The SQL with only its keywords, names, numbers and punctuation left
+    """
+    pattern = _MYSQL_LITERAL_PATTERN if database_type.lower() == "mysql" else _SQL_LITERAL_PATTERN
+    return pattern.sub(" ", sql)
+
+
 class SQLTranslator:
     """Translates natural language to SQL using LLMs."""
     
@@ -27,9 +90,18 @@ class SQLTranslator:
         
         self.client = AsyncOpenAI(
             api_key=config.llm.api_key,
-            base_url=config.llm.base_url
+            base_url=config.llm.base_url,
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=_HTTP_LIMITS,
+                timeout=_HTTP_TIMEOUT,
+                follow_redirects=True
+            )
         )
         self.model = config.llm.model
+        # Rendered schema blocks keyed by the identity of the TableSchema objects.
+        # The objects are held alongside, so their ids cannot be reused meanwhile.
+        self._schema_blocks: "OrderedDict[Tuple[int, ...], Tuple[Tuple[TableSchema, ...], str]]" = OrderedDict()
     
     async def translate_to_select(
         self, 
@@ -54,11 +126,11 @@ class SQLTranslator:
             
             # Create user prompt
             user_prompt = f"""
+Return ONLY the SQL query, without any explanation or additional text.
+
 Please convert this natural language query to SQL:
 
 "{natural_query}"
-
-Return ONLY the SQL query, without any explanation or additional text.
 """
             
             # Call LLM
@@ -80,6 +152,7 @@ Return ONLY the SQL query, without any explanation or additional text.
             # Validate that it's a SELECT query
             if not self._is_select_query(sql_query):
                 raise ValueError("Generated query is not a valid SELECT statement")
+            self._check_statement_safety(sql_query, database_type)
             
             logger.info(f"Successfully translated natural language to SQL: {sql_query}")
             
@@ -120,11 +193,11 @@ Return ONLY the SQL query, without any explanation or additional text.
             system_prompt = self._create_system_prompt(tables_schema, database_type, "INSERT")
             
             user_prompt = f"""
+Return ONLY the SQL statement, without any explanation or additional text.
+
 Please convert this natural language command to an INSERT SQL statement:
 
 "{natural_command}"
-
-Return ONLY the SQL statement, without any explanation or additional text.
 """
             
             response = await self.client.chat.completions.create(
@@ -142,6 +215,7 @@ Return ONLY the SQL statement, without any explanation or additional text.
             
             if not self._is_insert_query(sql_query):
                 raise ValueError("Generated query is not a valid INSERT statement")
+            self._check_statement_safety(sql_query, database_type)
             
             logger.info(f"Successfully translated natural language to INSERT: {sql_query}")
             
@@ -182,12 +256,12 @@ Return ONLY the SQL statement, without any explanation or additional text.
             system_prompt = self._create_system_prompt(tables_schema, database_type, "UPDATE")
             
             user_prompt = f"""
+Return ONLY the SQL statement, without any explanation or additional text.
+IMPORTANT: Always include a WHERE clause to prevent accidental bulk updates.
+
 Please convert this natural language command to an UPDATE SQL statement:
 
 "{natural_command}"
-
-Return ONLY the SQL statement, without any explanation or additional text.
-IMPORTANT: Always include a WHERE clause to prevent accidental bulk updates.
 """
             
             response = await self.client.chat.completions.create(
@@ -205,6 +279,7 @@ IMPORTANT: Always include a WHERE clause to prevent accidental bulk updates.
             
             if not self._is_update_query(sql_query):
                 raise ValueError("Generated query is not a valid UPDATE statement")
+            self._check_statement_safety(sql_query, database_type)
             
             # Safety check: ensure WHERE clause exists
             if "WHERE" not in sql_query.upper():
@@ -249,12 +324,12 @@ IMPORTANT: Always include a WHERE clause to prevent accidental bulk updates.
             system_prompt = self._create_system_prompt(tables_schema, database_type, "DELETE")
             
             user_prompt = f"""
+Return ONLY the SQL statement, without any explanation or additional text.
+CRITICAL: Always include a WHERE clause to prevent accidental bulk deletions.
+
 Please convert this natural language command to a DELETE SQL statement:
 
 "{natural_command}"
-
-Return ONLY the SQL statement, without any explanation or additional text.
-CRITICAL: Always include a WHERE clause to prevent accidental bulk deletions.
 """
             
             response = await self.client.chat.completions.create(
@@ -272,6 +347,7 @@ CRITICAL: Always include a WHERE clause to prevent accidental bulk deletions.
             
             if not self._is_delete_query(sql_query):
                 raise ValueError("Generated query is not a valid DELETE statement")
+            self._check_statement_safety(sql_query, database_type)
             
             # Safety check: ensure WHERE clause exists
             if "WHERE" not in sql_query.upper():
@@ -307,6 +383,39 @@ CRITICAL: Always include a WHERE clause to prevent accidental bulk deletions.
         Returns:
             System prompt string
         """
+        schema_info = self._render_schema_block(tables_schema)
+        
+        # Static instructions first, then the per-database schema, then the
+        # statement type, so consecutive requests share the longest possible
+        # byte-identical prefix for provider-side prompt caching.
+        return f"""{_SYSTEM_INSTRUCTIONS}
+Database type: {database_type}
+
+Database Schema:
+{schema_info}
+Statement type: {query_type}
+"""
+    
+    def _render_schema_block(self, tables_schema: List[TableSchema]) -> str:
+        """
+        Render table schemas as the schema section of the system prompt.
+        
+        The schema tools hand out the same cached TableSchema objects until
+        the database schema changes, so the rendering is memoized on the
+        identity of those objects.
+        
+        Args:
+            tables_schema: List of table schemas
+            
+        Returns:
+            Schema description text
+        """
+        key = tuple(id(table) for table in tables_schema)
+        cached = self._schema_blocks.get(key)
+        if cached is not None:
+            self._schema_blocks.move_to_end(key)
+            return cached[1]
+        
         schema_info = ""
         for table in tables_schema:
             schema_info += f"\nTable: {table.table_name}\n"
@@ -326,20 +435,10 @@ CRITICAL: Always include a WHERE clause to prevent accidental bulk deletions.
             
             schema_info += "\n"
         
-        return f"""You are an expert SQL translator for {database_type} databases.
-Your task is to convert natural language queries into valid {query_type} SQL statements.
-
-Database Schema:
-{schema_info}
-
-Guidelines:
-1. Generate only valid {database_type} SQL syntax
-2. Use appropriate table and column names from the schema
-3. For {query_type} queries, ensure proper syntax and safety measures
-4. Do not include explanations, only return the SQL statement
-5. Use double quotes for identifiers if needed
-6. Be precise with data types and constraints
-"""
+        self._schema_blocks[key] = (tuple(tables_schema), schema_info)
+        if len(self._schema_blocks) > _SCHEMA_BLOCK_CACHE_SIZE:
+            self._schema_blocks.popitem(last=False)
+        return schema_info
     
     def _clean_sql_query(self, sql: str) -> str:
         """Clean up the generated SQL query."""
@@ -356,6 +455,23 @@ Guidelines:
         
         return sql
     
+    def _check_statement_safety(self, sql: str, database_type: str) -> None:
+        """
+        Reject generated SQL that is more than the single requested statement.
+        
+        Raises:
+            ValueError: If the SQL holds several statements or a schema or
+                privilege change
+        """
+        code = blank_sql_literals(sql, database_type)
+        
+        if ";" in code.rstrip().rstrip(";"):
+            raise ValueError("Generated SQL contains more than one statement")
+        
+        match = _DISALLOWED_KEYWORD_PATTERN.search(code)
+        if match:
+            raise ValueError(f"Generated SQL contains disallowed keyword {match.group(1).upper()}")
+    
     def _is_select_query(self, sql: str) -> bool:
         """Check if the query is a valid SELECT statement."""
         return sql.strip().upper().startswith('SELECT')
@@ -383,3 +499,11 @@ def get_translator() -> SQLTranslator:
     if _translator is None:
         _translator = SQLTranslator()
     return _translator
+
+
+async def close_translator() -> None:
+    """Close the global translator's HTTP connections to the LLM API."""
+    global _translator
+    if _translator is not None:
+        await _translator.client.close()
+        _translator = None
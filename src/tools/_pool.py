@@ -0,0 +1,234 @@
+"""
+Database manager pool for the connection tools.
+
+Sessions that connect with identical settings borrow the same connected
+manager, and managers no longer used by any session are kept warm for a
+while so the next session can skip the connection handshake.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional
+
+from ..database import BaseManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledHandle:
+    """A session's claim on a pooled manager, returned to the pool on release."""
+    key: Hashable
+    manager: BaseManager
+
+
+@dataclass
+class _PoolEntry:
+    """A connected manager with its usage count and timestamps."""
+    key: Hashable
+    manager: BaseManager
+    created_at: float
+    sessions: int = 0
+    idle_since: Optional[float] = None
+
+
+class AsyncDBPool:
+    """
+    Pool of connected database managers keyed by connection settings.
+    
+    Each manager already holds its own driver-level connection pool, so this
+    pool shares managers rather than individual connections. A manager is
+    handed to every session acquiring its key, and once the last session
+    releases it the manager stays connected for idle_timeout seconds before
+    it is closed. Managers older than recycle seconds are not handed out
+    again, and idle managers are pinged in the background so dead
+    connections are dropped before a session borrows them.
+    """
+    
+    def __init__(
+        self,
+        recycle: float = 1800,
+        idle_timeout: float = 300,
+        pre_ping: bool = True,
+        ping_interval: float = 60
+    ):
+        """
+        Initialize the pool.
+        
+        Args:
+            recycle: Maximum age in seconds of a manager handed to a new session
+            idle_timeout: Seconds an unused manager is kept connected
+            pre_ping: Whether to check idle managers before reusing them
+            ping_interval: Seconds between background checks of idle managers
+        """
+        self.recycle = recycle
+        self.idle_timeout = idle_timeout
+        self.pre_ping = pre_ping
+        self.ping_interval = ping_interval
+        self._entries: Dict[Hashable, _PoolEntry] = {}
+        # Managers replaced while sessions still used them, closed on their last release
+        self._retired: Dict[BaseManager, _PoolEntry] = {}
+        self._maintenance_task: Optional[asyncio.Task] = None
+    
+    async def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], BaseManager]
+    ) -> Optional[PooledHandle]:
+        """
+        Borrow a connected manager for the given connection settings.
+        
+        Args:
+            key: Key identifying the connection settings
+            factory: Creates an unconnected manager if none can be reused
+        
+        Returns:
+            Handle to the manager, or None if a new connection could not be made
+        """
+        self._ensure_maintenance()
+        
+        entry = await self._reusable_entry(key)
+        if entry is None:
+            db_manager = factory()
+            if not await db_manager.connect():
+                return None
+            
+            entry = self._entries.get(key)
+            if entry is not None:
+                # Another session connected with the same settings meanwhile; use theirs
+                await db_manager.disconnect()
+            else:
+                entry = _PoolEntry(key, db_manager, created_at=time.monotonic())
+                self._entries[key] = entry
+        
+        entry.sessions += 1
+        entry.idle_since = None
+        return PooledHandle(key, entry.manager)
+    
+    async def prewarm(self, key: Hashable, factory: Callable[[], BaseManager]) -> bool:
+        """
+        Open a manager ahead of the first session that needs it.
+        
+        The manager waits in the pool without an idle timeout until a session
+        borrows it; pre-ping still checks it before it is handed out.
+        
+        Args:
+            key: Key identifying the connection settings
+            factory: Creates an unconnected manager for the settings
+            
+        Returns:
+            True if a connected manager for the key is now pooled
+        """
+        if key in self._entries:
+            return True
+        
+        db_manager = factory()
+        if not await db_manager.connect():
+            return False
+        
+        if key in self._entries:
+            await db_manager.disconnect()
+        else:
+            self._entries[key] = _PoolEntry(key, db_manager, created_at=time.monotonic())
+        return True
+    
+    async def release(self, handle: PooledHandle) -> None:
+        """Return a session's manager to the pool."""
+        entry = self._entries.get(handle.key)
+        if entry is None or entry.manager is not handle.manager:
+            # Already dropped from the pool; close it once no session uses it
+            retired = self._retired.get(handle.manager)
+            if retired is not None:
+                retired.sessions -= 1
+                if retired.sessions > 0:
+                    return
+                del self._retired[handle.manager]
+            await handle.manager.disconnect()
+            return
+        
+        entry.sessions -= 1
+        if entry.sessions > 0:
+            return
+        
+        if time.monotonic() - entry.created_at >= self.recycle:
+            del self._entries[handle.key]
+            await entry.manager.disconnect()
+        else:
+            entry.idle_since = time.monotonic()
+    
+    async def close_all(self) -> None:
+        """Stop background maintenance and disconnect every pooled manager."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        
+        managers = [entry.manager for entry in self._entries.values()]
+        managers.extend(self._retired)
+        self._entries.clear()
+        self._retired.clear()
+        await asyncio.gather(
+            *(manager.disconnect() for manager in managers),
+            return_exceptions=True
+        )
+    
+    async def _reusable_entry(self, key: Hashable) -> Optional[_PoolEntry]:
+        """Get the entry for a key if its manager can be handed out."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stale = time.monotonic() - entry.created_at >= self.recycle
+        if stale or (self.pre_ping and not await entry.manager.test_connection()):
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+                if entry.sessions == 0:
+                    await entry.manager.disconnect()
+                else:
+                    # Sessions still use it; release() closes it after the last one
+                    self._retired[entry.manager] = entry
+            return self._entries.get(key)
+        
+        return entry
+    
+    def _ensure_maintenance(self) -> None:
+        """Start the background maintenance task if it is not running."""
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.get_running_loop().create_task(self._maintain())
+    
+    async def _maintain(self) -> None:
+        """Periodically close expired idle managers and drop dead ones."""
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                await self._sweep_idle()
+            except Exception as e:
+                logger.error(f"Error maintaining database manager pool: {str(e)}")
+    
+    async def _sweep_idle(self) -> None:
+        """Close idle managers that expired or failed a connection check."""
+        now = time.monotonic()
+        expired: List[_PoolEntry] = []
+        to_ping: List[_PoolEntry] = []
+        
+        for entry in self._entries.values():
+            if entry.idle_since is None:
+                continue
+            if now - entry.idle_since >= self.idle_timeout or now - entry.created_at >= self.recycle:
+                expired.append(entry)
+            elif self.pre_ping:
+                to_ping.append(entry)
+        
+        results = await asyncio.gather(
+            *(entry.manager.test_connection() for entry in to_ping),
+            return_exceptions=True
+        )
+        expired.extend(entry for entry, ok in zip(to_ping, results) if ok is not True)
+        
+        for entry in expired:
+            # Skip entries borrowed again while the pings were in flight
+            if entry.idle_since is None or self._entries.get(entry.key) is not entry:
+                continue
+            del self._entries[entry.key]
+            await entry.manager.disconnect()
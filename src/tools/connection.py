@@ -5,24 +5,245 @@ This module provides tools for establishing and managing database connections.
 """
 
 import asyncio
-from typing import Dict, Any, Optional
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, Optional, Set, Tuple
 from fastmcp import Context
 
 from ..database import create_database_manager, BaseManager
 from ..core.config import config
 from ..core.exceptions import DatabaseConnectionError, ConfigurationError
+from ..core.session import get_session_id
+from ..core.tool_wrapper import tool_error_handler
+from ._pool import AsyncDBPool, PooledHandle
 
+logger = logging.getLogger(__name__)
 
-# Global dictionary to store database managers per session
-_database_managers: Dict[str, BaseManager] = {}
+# Per-process salt so stored keys cannot be precomputed from known session IDs
+_SESSION_KEY_SALT = os.urandom(16)
 
 
-def _get_session_id(ctx: Context) -> str:
-    """Get a unique session identifier from the context."""
-    # For now, use a simple approach - in production, you might want more sophisticated session management
-    return getattr(ctx, 'session_id', 'default_session')
+# Connected managers shared by all sessions with identical connection settings
+_pool = AsyncDBPool(
+    recycle=config.pool_recycle if config else 1800,
+    idle_timeout=config.pool_idle_timeout if config else 300,
+    pre_ping=config.pool_pre_ping if config else True,
+    ping_interval=config.pool_ping_interval if config else 60
+)
 
+# Releases running in the background, referenced until they finish
+_pending_releases: Set[asyncio.Task] = set()
 
+
+@dataclass
+class _SessionEntry:
+    """A session's pooled manager handle and its access and verification times."""
+    handle: PooledHandle
+    last_used: float
+    last_verified: float = 0.0
+
+
+class _SessionCache:
+    """
+    Bounded LRU mapping of session keys to pooled manager handles.
+    
+    Entries idle for longer than the TTL expire, and the least recently used
+    entry is evicted once more than max_sessions are stored. Entries are kept
+    in access order, so expired entries are always found at the front.
+    """
+    
+    def __init__(
+        self,
+        max_sessions: int,
+        ttl: float,
+        verify_ttl: float,
+        on_evict: Callable[[PooledHandle], None]
+    ):
+        """
+        Initialize the session cache.
+        
+        Args:
+            max_sessions: Maximum number of sessions to keep
+            ttl: Seconds of inactivity after which a session expires
+            verify_ttl: Seconds a successful connection check stays valid
+            on_evict: Called with the handle of each evicted session
+        """
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.verify_ttl = verify_ttl
+        self._on_evict = on_evict
+        self._entries: "OrderedDict[bytes, _SessionEntry]" = OrderedDict()
+    
+    def get(self, key: bytes) -> Optional[PooledHandle]:
+        """Get the handle stored for a session and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        now = time.monotonic()
+        if now - entry.last_used > self.ttl:
+            del self._entries[key]
+            self._on_evict(entry.handle)
+            return None
+        
+        entry.last_used = now
+        self._entries.move_to_end(key)
+        return entry.handle
+    
+    def put(self, key: bytes, handle: PooledHandle, verified: bool = False) -> Optional[PooledHandle]:
+        """
+        Store the handle for a session.
+        
+        Args:
+            key: Session key
+            handle: Pooled manager handle to store
+            verified: Whether the manager's connection was just checked
+            
+        Returns:
+            The handle previously stored for the session, if any
+        """
+        now = time.monotonic()
+        previous = self._entries.pop(key, None)
+        self._entries[key] = _SessionEntry(handle, now, now if verified else 0.0)
+        self._evict(now)
+        return previous.handle if previous is not None else None
+    
+    def pop(self, key: bytes) -> Optional[PooledHandle]:
+        """Remove a session and return its handle, if any."""
+        entry = self._entries.pop(key, None)
+        return entry.handle if entry is not None else None
+    
+    def is_verified(self, key: bytes) -> bool:
+        """Check whether the session's connection was verified within verify_ttl."""
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() - entry.last_verified < self.verify_ttl
+    
+    def mark_verified(self, key: bytes) -> None:
+        """Record a successful connection check for a session."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.last_verified = time.monotonic()
+    
+    def clear(self) -> None:
+        """Remove all sessions without evicting their handles."""
+        self._entries.clear()
+    
+    def _evict(self, now: float) -> None:
+        """Evict expired sessions and any beyond max_sessions, oldest first."""
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_sessions and now - entry.last_used <= self.ttl:
+                break
+            del self._entries[key]
+            self._on_evict(entry.handle)
+
+
+# Static responses, built once and returned as-is (callers never mutate them)
+_DISCONNECTED_RESPONSE = {
+    "success": True,
+    "message": "Database disconnected successfully"
+}
+
+_NO_CONNECTION_TO_CLOSE_RESPONSE = {
+    "success": False,
+    "message": "No active database connection found",
+    "suggestions": (
+        "Use connect_database tool to establish a connection first",
+        "Check if you're using the same session as when you connected"
+    )
+}
+
+_CONNECTION_NOT_WORKING_STATUS = {
+    "connected": False,
+    "message": "Database connection is not working",
+    "suggestions": (
+        "Try disconnecting and reconnecting to the database",
+        "Check if the database server is still running",
+        "Verify network connectivity"
+    )
+}
+
+_NO_CONNECTION_STATUS = {
+    "connected": False,
+    "message": "No database connection established",
+    "suggestions": (
+        "Use connect_database tool to establish a connection first",
+        "Provide valid database credentials and configuration"
+    )
+}
+
+
+def _session_key(session_id: str) -> bytes:
+    """Derive a fixed-size map key from a client-supplied session ID."""
+    return hashlib.sha256(_SESSION_KEY_SALT + session_id.encode()).digest()
+
+
+def _connection_key(db_type: str, connection_config: Dict[str, Any]) -> Tuple:
+    """Build the key under which a connected manager is shared between sessions."""
+    # The password is part of the key so a session only ever reuses a
+    # connection it could have opened with its own credentials
+    password_digest = hashlib.sha256(str(connection_config.get('password') or '').encode()).digest()
+    return (
+        db_type.lower(),
+        connection_config.get('host'),
+        connection_config.get('port'),
+        connection_config.get('username'),
+        connection_config.get('database'),
+        password_digest
+    )
+
+
+def _resolve_connection_config(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    database_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a connection configuration, filling unset values from config defaults."""
+    return {
+        'host': host or config.database.host,
+        'port': port or config.database.port,
+        'username': username or config.database.username,
+        'password': password or config.database.password,
+        'database': database_name or config.database.database,
+        'statement_cache_size': config.database.statement_cache_size,
+    }
+
+
+async def _safe_release(handle: PooledHandle) -> None:
+    """Return a manager to the pool, logging failures since no caller awaits this."""
+    try:
+        await _pool.release(handle)
+    except Exception as e:
+        logger.error(f"Error releasing database connection: {str(e)}")
+
+
+def _schedule_release(handle: PooledHandle) -> None:
+    """Return a session's manager to the pool without blocking the caller."""
+    task = asyncio.get_running_loop().create_task(_safe_release(handle))
+    _pending_releases.add(task)
+    task.add_done_callback(_pending_releases.discard)
+
+
+# Pooled manager handles per session, keyed by _session_key()
+_database_managers = _SessionCache(
+    max_sessions=config.max_sessions if config else 1000,
+    ttl=config.session_ttl if config else 3600,
+    verify_ttl=config.session_verify_ttl if config else 5.0,
+    on_evict=_schedule_release
+)
+
+
+@tool_error_handler(
+    "Database connection failed",
+    default_db_type=config.database.db_type if config else "unknown",
+    unexpected_log_message="Unexpected error during connection"
+)
 async def connect_database(
     ctx: Context,
     host: str = None,
@@ -49,93 +270,73 @@ async def connect_database(
     Returns:
         Dictionary with connection status and information
     """
-    session_id = _get_session_id(ctx)
+    session_id = get_session_id(ctx)
     
+    # Check if config is available
+    if config is None:
+        raise ConfigurationError(
+            "global_config",
+            "Configuration could not be loaded",
+            technical_details="Config object is None"
+        )
+    
+    # Use provided parameters or fall back to config defaults
+    connection_config = _resolve_connection_config(host, port, username, password, database_name)
+    
+    db_type = db_type or config.database.db_type
+    
+    await ctx.info(f"Attempting to connect to {db_type} database at {connection_config['host']}:{connection_config['port']}")
+    
+    # Borrow a connected manager, shared with sessions using the same settings
     try:
-        # Check if config is available
-        if config is None:
-            raise ConfigurationError(
-                "global_config",
-                "Configuration could not be loaded",
-                technical_details="Config object is None"
-            )
-        
-        # Use provided parameters or fall back to config defaults
-        connection_config = {
-            'host': host or config.database.host,
-            'port': port or config.database.port,
-            'username': username or config.database.username,
-            'password': password or config.database.password,
-            'database': database_name or config.database.database,
-        }
-        
-        db_type = db_type or config.database.db_type
-        
-        await ctx.info(f"Attempting to connect to {db_type} database at {connection_config['host']}:{connection_config['port']}")
-        
-        # Create database manager
-        try:
-            db_manager = create_database_manager(db_type, connection_config)
-        except ValueError as e:
-            raise DatabaseConnectionError(
-                db_type=db_type,
-                host=connection_config['host'],
-                port=connection_config['port'],
-                technical_details=str(e)
-            )
+        handle = await _pool.acquire(
+            _connection_key(db_type, connection_config),
+            factory=lambda: create_database_manager(db_type, connection_config)
+        )
+    except ValueError as e:
+        raise DatabaseConnectionError(
+            db_type=db_type,
+            host=connection_config['host'],
+            port=connection_config['port'],
+            technical_details=str(e)
+        )
+    
+    if handle is not None:
+        # Store the handle for this session, releasing any it held before
+        previous_handle = _database_managers.put(_session_key(session_id), handle, verified=True)
+        if previous_handle is not None:
+            await _pool.release(previous_handle)
         
-        # Attempt connection
-        success = await db_manager.connect()
+        await ctx.info("Database connection established successfully")
         
-        if success:
-            # Store the manager for this session
-            _database_managers[session_id] = db_manager
-            
-            await ctx.info("Database connection established successfully")
-            
-            return {
-                "success": True,
-                "message": "Successfully connected to database",
-                "database_type": db_type,
-                "host": connection_config['host'],
-                "port": connection_config['port'],
-                "database": connection_config['database'],
-                "session_id": session_id
-            }
-        else:
-            # Connection failed, raise appropriate exception
-            raise DatabaseConnectionError(
-                db_type=db_type,
-                host=connection_config['host'],
-                port=connection_config['port'],
-                technical_details="Connection attempt returned False"
-            )
-            
-    except DatabaseConnectionError as e:
-        await ctx.error(f"Database connection failed: {e.user_message}")
-        return {
-            "success": False,
-            "error": e.to_dict(include_technical=config.debug if config else False)
-        }
-    except ConfigurationError as e:
-        await ctx.error(f"Configuration error: {e.user_message}")
         return {
-            "success": False,
-            "error": e.to_dict(include_technical=config.debug if config else False)
+            "success": True,
+            "message": "Successfully connected to database",
+            "database_type": db_type,
+            "host": connection_config['host'],
+            "port": connection_config['port'],
+            "database": connection_config['database'],
+            "session_id": session_id
         }
-    except Exception as e:
-        # Unexpected error - convert to DatabaseConnectionError
-        db_error = DatabaseConnectionError(
-            db_type=db_type or "unknown",
-            technical_details=str(e)
+    else:
+        # Connection failed, raise appropriate exception
+        raise DatabaseConnectionError(
+            db_type=db_type,
+            host=connection_config['host'],
+            port=connection_config['port'],
+            technical_details="Connection attempt returned False"
         )
-        await ctx.error(f"Unexpected error during connection: {db_error.user_message}")
-        return {
-            "success": False,
-            "error": db_error.to_dict(include_technical=config.debug if config else False)
-        }
 
 
+@tool_error_handler(
+    "Disconnection error",
+    user_message="Failed to disconnect from database properly",
+    suggestions=[
+        "Connection may have been lost already",
+        "Try reconnecting if you need to use the database again",
+        "Check server logs for more details"
+    ]
+)
 async def disconnect_database(ctx: Context) -> Dict[str, Any]:
     """
     Disconnect from the current database session.
@@ -143,48 +344,27 @@ async def disconnect_database(ctx: Context) -> Dict[str, Any]:
     Returns:
         Dictionary with disconnection status
     """
-    session_id = _get_session_id(ctx)
-    
-    try:
-        if session_id in _database_managers:
-            db_manager = _database_managers[session_id]
-            await db_manager.disconnect()
-            del _database_managers[session_id]
-            
-            await ctx.info("Database disconnected successfully")
-            return {
-                "success": True,
-                "message": "Database disconnected successfully"
-            }
-        else:
-            return {
-                "success": False,
-                "message": "No active database connection found",
-                "suggestions": [
-                    "Use connect_database tool to establish a connection first",
-                    "Check if you're using the same session as when you connected"
-                ]
-            }
-            
-    except Exception as e:
-        db_error = DatabaseConnectionError(
-            db_type="unknown",
-            technical_details=str(e)
-        )
-        db_error.user_message = "Failed to disconnect from database properly"
-        db_error.suggestions = [
-            "Connection may have been lost already",
-            "Try reconnecting if you need to use the database again",
-            "Check server logs for more details"
-        ]
+    handle = _database_managers.pop(_session_key(get_session_id(ctx)))
+    if handle is not None:
+        # The session no longer sees the connection; closing it can finish later
+        _schedule_release(handle)
         
-        await ctx.error(f"Disconnection error: {db_error.user_message}")
-        return {
-            "success": False,
-            "error": db_error.to_dict(include_technical=config.debug if config else False)
-        }
+        await ctx.info("Database disconnected successfully")
+        return _DISCONNECTED_RESPONSE
+    else:
+        return _NO_CONNECTION_TO_CLOSE_RESPONSE
 
 
+@tool_error_handler(
+    "Error checking connection status",
+    status_key="connected",
+    user_message="Error checking database connection status",
+    suggestions=[
+        "Database connection may have been lost",
+        "Try reconnecting to the database",
+        "Check database server availability"
+    ]
+)
 async def get_connection_status(ctx: Context) -> Dict[str, Any]:
     """
     Get the current database connection status.
@@ -192,57 +372,29 @@ async def get_connection_status(ctx: Context) -> Dict[str, Any]:
     Returns:
         Dictionary with connection status information
     """
-    session_id = _get_session_id(ctx)
+    session_key = _session_key(get_session_id(ctx))
     
-    try:
-        if session_id in _database_managers:
-            db_manager = _database_managers[session_id]
+    handle = _database_managers.get(session_key)
+    if handle is not None:
+        db_manager = handle.manager
+        # Skip the round trip if the connection was checked moments ago
+        is_connected = _database_managers.is_verified(session_key)
+        if not is_connected:
             is_connected = await db_manager.test_connection()
-            
             if is_connected:
-                connection_info = db_manager.get_connection_info()
-                return {
-                    "connected": True,
-                    "message": "Database connection is active",
-                    "connection_info": connection_info
-                }
-            else:
-                return {
-                    "connected": False,
-                    "message": "Database connection is not working",
-                    "suggestions": [
-                        "Try disconnecting and reconnecting to the database",
-                        "Check if the database server is still running",
-                        "Verify network connectivity"
-                    ]
-                }
-        else:
+                _database_managers.mark_verified(session_key)
+        
+        if is_connected:
+            connection_info = db_manager.get_connection_info()
             return {
-                "connected": False,
-                "message": "No database connection established",
-                "suggestions": [
-                    "Use connect_database tool to establish a connection first",
-                    "Provide valid database credentials and configuration"
-                ]
+                "connected": True,
+                "message": "Database connection is active",
+                "connection_info": connection_info
             }
-            
-    except Exception as e:
-        db_error = DatabaseConnectionError(
-            db_type="unknown",
-            technical_details=str(e)
-        )
-        db_error.user_message = "Error checking database connection status"
-        db_error.suggestions = [
-            "Database connection may have been lost",
-            "Try reconnecting to the database",
-            "Check database server availability"
-        ]
-        
-        await ctx.error(f"Error checking connection status: {db_error.user_message}")
-        return {
-            "connected": False,
-            "error": db_error.to_dict(include_technical=config.debug if config else False)
-        }
+        else:
+            return _CONNECTION_NOT_WORKING_STATUS
+    else:
+        return _NO_CONNECTION_STATUS
 
 
 def get_database_manager(ctx: Context) -> Optional[BaseManager]:
@@ -254,5 +406,45 @@ def get_database_manager(ctx: Context) -> Optional[BaseManager]:
     Returns:
         Database manager instance or None if not connected
     """
-    session_id = _get_session_id(ctx)
-    return _database_managers.get(session_id)
+    handle = _database_managers.get(_session_key(get_session_id(ctx)))
+    return handle.manager if handle is not None else None
+
+
+async def prewarm_default_connection() -> bool:
+    """
+    Open a pooled connection to the configured default database.
+    
+    Called on server startup when POOL_PREWARM is enabled, so the first
+    connect_database call using the default settings borrows a warm
+    connection instead of waiting for the handshake.
+    
+    Returns:
+        True if a connection to the default database is ready in the pool
+    """
+    if config is None or not config.pool_prewarm:
+        return False
+    
+    connection_config = _resolve_connection_config()
+    db_type = config.database.db_type
+    try:
+        return await _pool.prewarm(
+            _connection_key(db_type, connection_config),
+            factory=lambda: create_database_manager(db_type, connection_config)
+        )
+    except Exception as e:
+        logger.warning(f"Could not prewarm {db_type} connection: {str(e)}")
+        return False
+
+
+async def close_all_connections() -> None:
+    """
+    Disconnect the database managers of all sessions.
+    
+    Called on server shutdown so pooled connections, including those held
+    by sessions that never called disconnect_database, are closed rather
+    than leaked.
+    """
+    _database_managers.clear()
+    # Let background releases finish so no manager is closed twice at once
+    await asyncio.gather(*_pending_releases, return_exceptions=True)
+    await _pool.close_all()
@@ -5,12 +5,17 @@ This module provides tools for executing natural language queries
 and data modification commands against the database.
 """
 
+import asyncio
 import json
-from typing import Dict, Any, List
+import re
+from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 from fastmcp import Context
 
 from .connection import get_database_manager
-from ..nlp.translator import get_translator
+from ..database import BaseManager, TableSchema
+from ..nlp.translator import get_translator, blank_sql_literals
 from ..core.exceptions import (
     DatabaseConnectionError, 
     QueryTranslationError, 
@@ -18,17 +23,328 @@ from ..core.exceptions import (
     ValidationError
 )
 from ..core.config import config
+from ..core.session import get_session_id
 from ..core.session_manager import session_manager
-from ..core.cache import cache_query_result, query_cache, schema_cache
+from ..core.cache import query_cache, schema_cache, answer_cache
+from ..core.log_buffer import LogBuffer
 import time
 
 
-def _get_session_id(ctx: Context) -> str:
-    """Get session ID from context."""
-    return getattr(ctx, 'session_id', 'default_session')
+# Words of a table's name, words of its column names, and its estimated prompt tokens
+_TableProfile = Tuple[FrozenSet[str], FrozenSet[str], int]
+
+
+@dataclass
+class _SchemaSnapshot:
+    """Introspected tables of a database, valid for one schema version."""
+    version: Any  # Schema version reported by the manager, None if it cannot tell
+    tables: List[str]
+    schemas: Dict[str, Optional[TableSchema]]  # None for tables without accessible columns
+    profiles: Dict[str, _TableProfile]
+    fetched_at: float  # time.monotonic() when the table list was read
+
+
+# Introspected schema per connected manager. Managers are shared between sessions,
+# so one session's introspection serves all of them.
+_schema_cache: "WeakKeyDictionary[BaseManager, _SchemaSnapshot]" = WeakKeyDictionary()
+
+# Answers being computed, by answer cache key, so identical concurrent queries run once
+_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+# Row limit clauses ending a statement, through which it already limits its own rows
+_ROW_LIMIT_PATTERN = re.compile(
+    r'\b(?:LIMIT\s+(?:\d+|ALL)(?:\s*,\s*\d+|\s+OFFSET\s+\d+)?'
+    r'|OFFSET\s+\d+(?:\s+ROWS?)?(?:\s+FETCH\s+(?:FIRST|NEXT)\s+\d*\s*ROWS?\s+ONLY)?'
+    r'|FETCH\s+(?:FIRST|NEXT)\s+\d*\s*ROWS?\s+ONLY)\s*;?\s*$',
+    re.IGNORECASE
+)
+
+# Innermost parenthesized groups, removed repeatedly to leave a statement's outer level
+_PARENTHESIZED_PATTERN = re.compile(r'\([^()]*\)')
+
+# Words of a question or of a table or column name
+_TERM_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def _terms(text: str) -> FrozenSet[str]:
+    """Split text into lowercase words, dropping a plural 's' so "orders" matches "order"."""
+    return frozenset(
+        word[:-1] if len(word) > 3 and word.endswith('s') else word
+        for word in _TERM_PATTERN.findall(text.lower())
+    )
+
+
+def _table_profile(schema: TableSchema) -> _TableProfile:
+    """
+    Get the words of a table's name and columns and its estimated prompt size.
+    
+    Returns:
+        Tuple of (table name words, column name words, estimated tokens)
+    """
+    column_terms = frozenset().union(*(_terms(col['column_name']) for col in schema.columns))
+    
+    # Roughly four characters per token for the schema block the translator renders
+    chars = 32 + len(schema.table_name) + sum(
+        16 + len(col['column_name']) + len(str(col.get('data_type')))
+        for col in schema.columns
+    )
+    return _terms(schema.table_name), column_terms, chars // 4 + 1
+
+
+def _select_relevant_schemas(
+    question: str,
+    schemas: List[TableSchema],
+    profiles: Dict[str, _TableProfile],
+    token_budget: int
+) -> List[TableSchema]:
+    """
+    Pick the schemas to show the translator for a question.
+    
+    Tables are ranked by the question words found in their name (counted
+    twice) and column names, ties keeping database order, and taken in that
+    order while their schemas fit in the token budget. The best ranked table
+    is always included.
+    
+    Args:
+        question: Natural language question or command
+        schemas: Schemas of all accessible tables
+        profiles: Relevance profile of each table, by table name
+        token_budget: Approximate number of prompt tokens for the schemas
+        
+    Returns:
+        Selected schemas, best ranked first
+    """
+    question_terms = _terms(question)
+    
+    def rank(item: Tuple[int, TableSchema]) -> Tuple[int, int]:
+        position, schema = item
+        table_terms, column_terms, _ = profiles[schema.table_name]
+        score = 2 * len(question_terms & table_terms) + len(question_terms & column_terms)
+        return -score, position
+    
+    selected = []
+    used_tokens = 0
+    for _, schema in sorted(enumerate(schemas), key=rank):
+        tokens = profiles[schema.table_name][2]
+        if selected and used_tokens + tokens > token_budget:
+            continue  # A smaller, lower ranked table may still fit
+        selected.append(schema)
+        used_tokens += tokens
+    
+    return selected
+
+
+async def _get_cached_schemas(
+    log: LogBuffer,
+    db_manager: BaseManager,
+    question: str
+) -> Tuple[List[str], List[TableSchema]]:
+    """
+    Get the database's table names and the table schemas relevant to a question.
+    
+    Introspection results are reused for as long as the manager reports the
+    same schema version, so repeated commands skip the catalog queries.
+    Managers that cannot report a version reuse them for CACHE_TTL seconds.
+    
+    Args:
+        log: Log buffer of the tool call, used to report inaccessible tables
+        db_manager: Connected database manager
+        question: Natural language question or command the schemas are for
+        
+    Returns:
+        Tuple of (all table names, selected schemas with at least one column)
+    """
+    version = await db_manager.get_schema_version()
+    snapshot = _schema_cache.get(db_manager)
+    schema_ttl = config.cache_ttl if config else 300
+    
+    if snapshot is None or snapshot.version != version or (
+        version is None and time.monotonic() - snapshot.fetched_at >= schema_ttl
+    ):
+        snapshot = _SchemaSnapshot(version, await db_manager.get_tables(), {}, {}, time.monotonic())
+        _schema_cache[db_manager] = snapshot
+    
+    tables, table_schemas, profiles = snapshot.tables, snapshot.schemas, snapshot.profiles
+    
+    # Ranking tables needs all of their columns; fetch the ones not cached yet in one batch
+    missing = [name for name in tables if name not in table_schemas]
+    if missing:
+        try:
+            for schema in await db_manager.get_schemas_bulk(missing):
+                table_schemas[schema.table_name] = schema
+            # The catalog was read and lists no columns for the tables left out;
+            # remember that until the schema changes. A failed read raises
+            # instead, so nothing is cached and the next call tries again.
+            for table_name in missing:
+                table_schemas.setdefault(table_name, None)
+        except Exception as e:
+            await log.warning("Could not access table schemas: %s", e)
+    
+    accessible = []
+    for table_name in tables:
+        schema = table_schemas.get(table_name)
+        if schema is not None:
+            accessible.append(schema)
+            if table_name not in profiles:
+                profiles[table_name] = _table_profile(schema)
+    
+    token_budget = config.schema_token_budget if config else 6000
+    schemas = _select_relevant_schemas(question, accessible, profiles, token_budget)
+    
+    # A fixed table order keeps the translator prompt byte-identical between calls
+    schemas.sort(key=lambda schema: schema.table_name)
+    
+    return tables, schemas
+
+
+def _apply_row_limit(sql_query: str, row_limit: int, db_type: str) -> str:
+    """
+    Add a LIMIT to a SELECT that does not limit its rows.
+    
+    Query tools pass max_result_rows + 1; the one extra row shows whether
+    the result had to be truncated without the database returning, and the
+    server holding, the rest of it.
+    
+    Only a limit ending the outer statement counts: one in a subquery, CTE,
+    string literal or comment leaves the result unbounded. The statement is
+    not wrapped in SELECT * FROM (...), which would lose its ORDER BY on
+    MySQL and fail there on duplicate column names from joins.
+    
+    Args:
+        sql_query: Generated SELECT statement
+        row_limit: Maximum number of rows to fetch
+        db_type: Type of database, which decides how literals are quoted
+        
+    Returns:
+        The statement with a row limit, or unchanged if it already has one
+    """
+    outer = blank_sql_literals(sql_query, db_type)
+    while True:
+        stripped = _PARENTHESIZED_PATTERN.sub(" ", outer)
+        if stripped == outer:
+            break
+        outer = stripped
+    
+    if _ROW_LIMIT_PATTERN.search(outer):
+        return sql_query
+    
+    # On its own line so a trailing comment cannot swallow it
+    return f"{sql_query.rstrip().rstrip(';').rstrip()}\nLIMIT {row_limit};"
+
+
+async def _translate_and_execute(
+    log: LogBuffer,
+    db_manager: BaseManager,
+    natural_language_query: str,
+    schemas: List[TableSchema],
+    db_type: str
+) -> Dict[str, Any]:
+    """
+    Translate a natural language query to SQL and execute it.
+    
+    Returns:
+        Dictionary with generated_sql, results, row_count and truncated
+    """
+    # Translate natural language to SQL
+    await log.info("Translating natural language to SQL")
+    translator = get_translator()
+    
+    translation_result = await translator.translate_to_select(
+        natural_language_query,
+        schemas,
+        database_type=db_type
+    )
+    
+    if not translation_result["success"]:
+        raise QueryTranslationError(
+            query=natural_language_query,
+            reason=translation_result.get('error', 'Translation failed'),
+            technical_details=str(translation_result)
+        )
+    
+    # Never fetch more rows than can be returned
+    max_rows = config.max_result_rows if config else 1000
+    row_limit = max_rows + 1
+    sql_query = _apply_row_limit(translation_result["sql_query"], row_limit, db_type)
+    await log.info("Generated SQL: %s", sql_query)
+    
+    # Execute the SQL query
+    await log.info("Executing SQL query against database")
+    # The driver also stops at the cap in case the generated SQL kept a larger LIMIT
+    query_result = await db_manager.execute_query(sql_query, max_rows=row_limit)
+    
+    if not query_result.success:
+        raise QueryExecutionError(
+            sql_query=sql_query,
+            db_error=query_result.error_message,
+            technical_details=f"Row count: {query_result.row_count}"
+        )
+    
+    # Only max_rows + 1 rows are fetched, so a longer result's full size is unknown;
+    # row_count is the number of rows returned and truncated says there were more
+    truncated = query_result.row_count > max_rows
+    if truncated:
+        await log.warning("Result set exceeds limit (%d rows). Truncating results.", max_rows)
+        query_result.data = query_result.data[:max_rows]
+    
+    await log.info("Query executed successfully, returned %d rows", len(query_result.data))
+    
+    return {
+        "generated_sql": sql_query,
+        "results": query_result.data,
+        "row_count": len(query_result.data),
+        "truncated": truncated
+    }
+
+
+async def _answer_query(
+    log: LogBuffer,
+    db_manager: BaseManager,
+    natural_language_query: str,
+    schemas: List[TableSchema],
+    db_type: str,
+    answer_key: str
+) -> Dict[str, Any]:
+    """
+    Answer a query, sharing the work with identical queries already running.
+    
+    Calls with the same answer key (same question, connection and schemas)
+    that arrive while one is being answered wait for its result instead of
+    translating and executing the query again.
+    
+    Returns:
+        Dictionary with generated_sql, results, row_count and truncated
+    """
+    pending = _inflight.get(answer_key)
+    if pending is not None:
+        await log.info("Waiting for an identical query already in progress")
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            # The call answering it was cancelled, so answer this one ourselves
+    
+    pending = asyncio.get_running_loop().create_future()
+    _inflight[answer_key] = pending
+    try:
+        answer = await _translate_and_execute(log, db_manager, natural_language_query, schemas, db_type)
+    except asyncio.CancelledError:
+        pending.cancel()
+        raise
+    except Exception as e:
+        pending.set_exception(e)
+        # Mark the exception retrieved in case no other call was waiting for it
+        pending.exception()
+        raise
+    else:
+        pending.set_result(answer)
+        return answer
+    finally:
+        if _inflight.get(answer_key) is pending:
+            del _inflight[answer_key]
 
 
-@cache_query_result(ttl=600)  # Cache for 10 minutes
 async def query_data(ctx: Context, natural_language_query: str) -> Dict[str, Any]:
     """
     Execute a natural language query against the database.
@@ -43,13 +359,16 @@ async def query_data(ctx: Context, natural_language_query: str) -> Dict[str, Any
         Dictionary containing query results or error information
     """
     start_time = time.time()
-    session_id = _get_session_id(ctx)
+    session_id = get_session_id(ctx)
+    log = LogBuffer(ctx)
     sql_query = ""
     db_type = "unknown"
     
     try:
-        # Validate input
-        if not natural_language_query or not natural_language_query.strip():
+        # Validate input; the stripped form is used downstream so whitespace
+        # variations don't change the prompt or history entries
+        natural_language_query = natural_language_query.strip() if natural_language_query else ""
+        if not natural_language_query:
             raise ValidationError(
                 "natural_language_query",
                 "empty string",
@@ -65,18 +384,19 @@ async def query_data(ctx: Context, natural_language_query: str) -> Dict[str, Any
                 technical_details="No database manager found in session"
             )
         
-        # Check if connection is still active
-        if not await db_manager.test_connection():
+        # No ping per query: a dropped connection makes the query itself fail with
+        # its own error, so only check the manager was not disconnected
+        if not db_manager.is_connected:
             raise DatabaseConnectionError(
                 db_type="unknown",
-                technical_details="Connection test failed"
+                technical_details="Database manager is disconnected"
             )
         
-        await ctx.info(f"Processing natural language query: {natural_language_query}")
+        await log.info("Processing natural language query: %s", natural_language_query)
         
         # Get database schema for context
-        await ctx.info("Retrieving database schema for query context")
-        tables = await db_manager.get_tables()
+        await log.info("Retrieving database schema for query context")
+        tables, schemas = await _get_cached_schemas(log, db_manager, natural_language_query)
         
         if not tables:
             raise QueryTranslationError(
@@ -85,19 +405,6 @@ async def query_data(ctx: Context, natural_language_query: str) -> Dict[str, Any
                 technical_details="get_tables() returned empty list"
             )
         
-        # Get schema for all tables (limit for performance)
-        schemas = []
-        max_tables = config.max_result_rows // 100 if config else 10  # Dynamic limit based on config
-        table_limit = min(len(tables), max_tables)
-        
-        for table_name in tables[:table_limit]:
-            try:
-                schema = await db_manager.get_table_schema(table_name)
-                if schema.columns:  # Only include tables we can access
-                    schemas.append(schema)
-            except Exception as e:
-                await ctx.warning(f"Could not access schema for table {table_name}: {str(e)}")
-        
         if not schemas:
             raise QueryTranslationError(
                 query=natural_language_query,
@@ -105,50 +412,30 @@ async def query_data(ctx: Context, natural_language_query: str) -> Dict[str, Any
                 technical_details="All table schema requests failed"
             )
         
-        await ctx.info(f"Using schema from {len(schemas)} tables for query translation")
+        await log.info("Using schema from %d tables for query translation", len(schemas))
         
-        # Translate natural language to SQL
-        await ctx.info("Translating natural language to SQL")
-        translator = get_translator()
+        # The session may be connected to a different database type than configured
+        db_type = db_manager.db_type
         
-        # Get database type from config or manager
-        db_type = config.database.db_type if config else "postgresql"
+        # Reuse the answer to an identical recent question against the same schema.
+        # This sits after schema retrieval so a changed schema never reuses old SQL.
+        answer_key = answer_cache.make_key(natural_language_query, db_manager.get_connection_info(), schemas)
+        cached_answer = None
+        if config and config.enable_query_caching:
+            cached_answer = await answer_cache.get_shared(answer_key)
         
-        translation_result = await translator.translate_to_select(
-            natural_language_query,
-            schemas,
-            database_type=db_type
-        )
+        if cached_answer is not None:
+            await log.info("Reusing the answer to an identical recent query")
+            answer = cached_answer
+        else:
+            answer = await _answer_query(log, db_manager, natural_language_query, schemas, db_type, answer_key)
+            if config and config.enable_query_caching:
+                answer = await answer_cache.set_shared(answer_key, answer)
         
-        if not translation_result["success"]:
-            raise QueryTranslationError(
-                query=natural_language_query,
-                reason=translation_result.get('error', 'Translation failed'),
-                technical_details=str(translation_result)
-            )
-        
-        sql_query = translation_result["sql_query"]
-        await ctx.info(f"Generated SQL: {sql_query}")
-        
-        # Execute the SQL query
-        await ctx.info("Executing SQL query against database")
-        query_result = await db_manager.execute_query(sql_query)
-        
-        if not query_result.success:
-            raise QueryExecutionError(
-                sql_query=sql_query,
-                db_error=query_result.error_message,
-                technical_details=f"Row count: {query_result.row_count}"
-            )
-        
-        await ctx.info(f"Query executed successfully, returned {query_result.row_count} rows")
-        
-        # Check if result set is too large
-        max_rows = config.max_result_rows if config else 1000
-        truncated = query_result.row_count > max_rows
-        if truncated:
-            await ctx.warning(f"Result set ({query_result.row_count} rows) exceeds limit ({max_rows}). Truncating results.")
-            query_result.data = query_result.data[:max_rows]
+        sql_query = answer["generated_sql"]
+        results = answer["results"]
+        row_count = answer["row_count"]
+        truncated = answer["truncated"]
         
         # Record successful query in history
         execution_time = time.time() - start_time
@@ -159,27 +446,32 @@ async def query_data(ctx: Context, natural_language_query: str) -> Dict[str, Any
                     natural_query=natural_language_query,
                     sql_query=sql_query,
                     execution_time=execution_time,
-                    results_count=query_result.row_count,
+                    results_count=row_count,
                     success=True,
                     database_type=db_type
                 )
             except Exception as e:
-                await ctx.warning(f"Failed to record query in history: {str(e)}")
+                await log.warning("Failed to record query in history: %s", e)
+        
+        await log.flush()
         
         # Format results for return
         return {
             "success": True,
-            "message": f"Query executed successfully, returned {len(query_result.data)} rows",
+            "message": f"Query executed successfully, returned {len(results)} rows",
             "original_query": natural_language_query,
             "generated_sql": sql_query,
-            "row_count": query_result.row_count,
-            "results": query_result.data,
+            "row_count": row_count,
+            "results": results,
             "truncated": truncated,
+            "cached": cached_answer is not None,
             "execution_time": round(execution_time, 3)
         }
         
     except (DatabaseConnectionError, QueryTranslationError, QueryExecutionError, ValidationError) as e:
+        await log.flush()
         await ctx.error(f"Query processing failed: {e.user_message}")
+        sql_query = sql_query or getattr(e, 'sql_query', "")
         
         # Record failed query in history
         execution_time = time.time() - start_time
@@ -212,6 +504,7 @@ async def query_data(ctx: Context, natural_language_query: str) -> Dict[str, Any
             technical_details=str(e)
         )
         
+        await log.flush()
         await ctx.error(f"Unexpected error during query: {unexpected_error.user_message}")
         
         # Record unexpected error in history
@@ -239,19 +532,40 @@ async def query_data(ctx: Context, natural_language_query: str) -> Dict[str, Any
         }
 
 
-async def add_data(ctx: Context, natural_language_command: str) -> Dict[str, Any]:
+@dataclass(frozen=True)
+class _DataCommand:
+    """How a data modification tool translates, reports and executes its command."""
+    statement: str  # SQL statement type, such as "INSERT"
+    action: str  # Noun for the operation in messages, such as "insertion"
+    done: str  # Past participle for the operation in messages, such as "inserted"
+    modifies_existing: bool  # Whether the statement changes rows that already exist
+    irreversible: bool = False  # Whether progress is reported as warnings
+
+
+_INSERT = _DataCommand("INSERT", "insertion", "inserted", modifies_existing=False)
+_UPDATE = _DataCommand("UPDATE", "update", "updated", modifies_existing=True)
+_DELETE = _DataCommand("DELETE", "deletion", "deleted", modifies_existing=True, irreversible=True)
+
+
+async def _run_data_command(
+    ctx: Context,
+    natural_language_command: str,
+    command: _DataCommand
+) -> Dict[str, Any]:
     """
-    Add data to the database using natural language commands.
-    
-    This tool translates a natural language command into a SQL INSERT statement
-    and executes it against the connected database.
+    Translate a natural language data modification command to SQL and execute it.
     
     Args:
-        natural_language_command: The natural language command for adding data
+        ctx: Tool context
+        natural_language_command: The natural language command
+        command: Statement type and wording of the calling tool
         
     Returns:
         Dictionary containing operation results
     """
+    log = LogBuffer(ctx)
+    report = log.warning if command.irreversible else log.info
+    
     try:
         # Get the database manager for this session
         db_manager = get_database_manager(ctx)
@@ -263,44 +577,38 @@ async def add_data(ctx: Context, natural_language_command: str) -> Dict[str, Any
                 "message": "No database connection found"
             }
         
-        if not await db_manager.test_connection():
+        if not db_manager.is_connected:
             await ctx.error("Database connection is not active")
             return {
                 "success": False,
                 "message": "Database connection is not active"
             }
         
-        await ctx.info(f"Processing data insertion command: {natural_language_command}")
+        await report("Processing data %s command: %s", command.action, natural_language_command)
         
         # Get database schema for context
-        tables = await db_manager.get_tables()
-        schemas = []
-        
-        for table_name in tables[:10]:  # Limit for performance
-            try:
-                schema = await db_manager.get_table_schema(table_name)
-                if schema.columns:
-                    schemas.append(schema)
-            except Exception as e:
-                await ctx.warning(f"Could not access schema for table {table_name}: {str(e)}")
+        _, schemas = await _get_cached_schemas(log, db_manager, natural_language_command)
         
         if not schemas:
+            await log.flush()
             return {
                 "success": False,
                 "message": "Could not access any table schemas"
             }
         
-        # Translate to INSERT SQL
-        await ctx.info("Translating natural language command to INSERT SQL")
+        # Translate to SQL of the command's statement type
+        await report("Translating natural language command to %s SQL", command.statement)
         translator = get_translator()
+        translate = getattr(translator, f"translate_to_{command.statement.lower()}")
         
-        translation_result = await translator.translate_to_insert(
+        translation_result = await translate(
             natural_language_command,
             schemas,
-            database_type="postgresql"
+            database_type=db_manager.db_type
         )
         
         if not translation_result["success"]:
+            await log.flush()
             await ctx.error(f"Failed to translate command: {translation_result.get('error', 'Unknown error')}")
             return {
                 "success": False,
@@ -309,40 +617,74 @@ async def add_data(ctx: Context, natural_language_command: str) -> Dict[str, Any
             }
         
         sql_query = translation_result["sql_query"]
-        await ctx.info(f"Generated SQL: {sql_query}")
+        await report("Generated SQL: %s", sql_query)
+        
+        # Safety confirmation for statements changing existing rows
+        if command.irreversible:
+            await log.warning("WARNING: About to execute %s statement. This operation cannot be undone!", command.statement)
+        elif command.modifies_existing:
+            await log.warning("About to execute %s statement: %s", command.statement, sql_query)
+        else:
+            await log.info("Executing %s statement", command.statement)
+        
+        # Send progress, including the warnings above, before the statement runs
+        await log.flush()
         
-        # Execute the INSERT query
-        await ctx.info("Executing INSERT statement")
         query_result = await db_manager.execute_query(sql_query)
         
         if not query_result.success:
-            await ctx.error(f"INSERT execution failed: {query_result.error_message}")
+            await ctx.error(f"{command.statement} execution failed: {query_result.error_message}")
             return {
                 "success": False,
-                "message": "INSERT statement execution failed",
+                "message": f"{command.statement} statement execution failed",
                 "error": query_result.error_message,
                 "generated_sql": sql_query
             }
         
-        await ctx.info("Data inserted successfully")
+        # Cached answers for this database may no longer be accurate
+        await answer_cache.invalidate_shared(db_manager.get_connection_info())
         
-        return {
+        message = f"Data {command.done} successfully, {query_result.row_count} rows affected"
+        await report(message)
+        await log.flush()
+        
+        response = {
             "success": True,
-            "message": "Data inserted successfully",
+            "message": message,
             "original_command": natural_language_command,
             "generated_sql": sql_query,
             "affected_rows": query_result.row_count
         }
+        if command.irreversible:
+            response["warning"] = f"{command.action.capitalize()} completed - this operation cannot be undone"
+        return response
         
     except Exception as e:
-        await ctx.error(f"Error processing data insertion: {str(e)}")
+        await log.flush()
+        await ctx.error(f"Error processing data {command.action}: {str(e)}")
         return {
             "success": False,
-            "message": "Error processing data insertion command",
+            "message": f"Error processing data {command.action} command",
             "error": str(e)
         }
 
 
+async def add_data(ctx: Context, natural_language_command: str) -> Dict[str, Any]:
+    """
+    Add data to the database using natural language commands.
+    
+    This tool translates a natural language command into a SQL INSERT statement
+    and executes it against the connected database.
+    
+    Args:
+        natural_language_command: The natural language command for adding data
+        
+    Returns:
+        Dictionary containing operation results
+    """
+    return await _run_data_command(ctx, natural_language_command, _INSERT)
+
+
 async def update_data(ctx: Context, natural_language_command: str) -> Dict[str, Any]:
     """
     Update data in the database using natural language commands.
@@ -356,96 +698,7 @@ async def update_data(ctx: Context, natural_language_command: str) -> Dict[str,
     Returns:
         Dictionary containing operation results
     """
-    try:
-        db_manager = get_database_manager(ctx)
-        
-        if not db_manager:
-            await ctx.error("No database connection found. Please connect to a database first.")
-            return {
-                "success": False,
-                "message": "No database connection found"
-            }
-        
-        if not await db_manager.test_connection():
-            await ctx.error("Database connection is not active")
-            return {
-                "success": False,
-                "message": "Database connection is not active"
-            }
-        
-        await ctx.info(f"Processing data update command: {natural_language_command}")
-        
-        # Get database schema
-        tables = await db_manager.get_tables()
-        schemas = []
-        
-        for table_name in tables[:10]:
-            try:
-                schema = await db_manager.get_table_schema(table_name)
-                if schema.columns:
-                    schemas.append(schema)
-            except Exception as e:
-                await ctx.warning(f"Could not access schema for table {table_name}: {str(e)}")
-        
-        if not schemas:
-            return {
-                "success": False,
-                "message": "Could not access any table schemas"
-            }
-        
-        # Translate to UPDATE SQL
-        await ctx.info("Translating natural language command to UPDATE SQL")
-        translator = get_translator()
-        
-        translation_result = await translator.translate_to_update(
-            natural_language_command,
-            schemas,
-            database_type="postgresql"
-        )
-        
-        if not translation_result["success"]:
-            await ctx.error(f"Failed to translate command: {translation_result.get('error', 'Unknown error')}")
-            return {
-                "success": False,
-                "message": "Failed to translate natural language to SQL",
-                "error": translation_result.get('error')
-            }
-        
-        sql_query = translation_result["sql_query"]
-        await ctx.info(f"Generated SQL: {sql_query}")
-        
-        # Safety confirmation for UPDATE
-        await ctx.warning(f"About to execute UPDATE statement: {sql_query}")
-        
-        # Execute the UPDATE query
-        query_result = await db_manager.execute_query(sql_query)
-        
-        if not query_result.success:
-            await ctx.error(f"UPDATE execution failed: {query_result.error_message}")
-            return {
-                "success": False,
-                "message": "UPDATE statement execution failed",
-                "error": query_result.error_message,
-                "generated_sql": sql_query
-            }
-        
-        await ctx.info(f"Data updated successfully, {query_result.row_count} rows affected")
-        
-        return {
-            "success": True,
-            "message": f"Data updated successfully, {query_result.row_count} rows affected",
-            "original_command": natural_language_command,
-            "generated_sql": sql_query,
-            "affected_rows": query_result.row_count
-        }
-        
-    except Exception as e:
-        await ctx.error(f"Error processing data update: {str(e)}")
-        return {
-            "success": False,
-            "message": "Error processing data update command",
-            "error": str(e)
-        }
+    return await _run_data_command(ctx, natural_language_command, _UPDATE)
 
 
 async def delete_data(ctx: Context, natural_language_command: str) -> Dict[str, Any]:
@@ -464,94 +717,4 @@ async def delete_data(ctx: Context, natural_language_command: str) -> Dict[str,
     Returns:
         Dictionary containing operation results
     """
-    try:
-        db_manager = get_database_manager(ctx)
-        
-        if not db_manager:
-            await ctx.error("No database connection found. Please connect to a database first.")
-            return {
-                "success": False,
-                "message": "No database connection found"
-            }
-        
-        if not await db_manager.test_connection():
-            await ctx.error("Database connection is not active")
-            return {
-                "success": False,
-                "message": "Database connection is not active"
-            }
-        
-        await ctx.warning(f"Processing DELETION command: {natural_language_command}")
-        
-        # Get database schema
-        tables = await db_manager.get_tables()
-        schemas = []
-        
-        for table_name in tables[:10]:
-            try:
-                schema = await db_manager.get_table_schema(table_name)
-                if schema.columns:
-                    schemas.append(schema)
-            except Exception as e:
-                await ctx.warning(f"Could not access schema for table {table_name}: {str(e)}")
-        
-        if not schemas:
-            return {
-                "success": False,
-                "message": "Could not access any table schemas"
-            }
-        
-        # Translate to DELETE SQL
-        await ctx.warning("Translating natural language command to DELETE SQL")
-        translator = get_translator()
-        
-        translation_result = await translator.translate_to_delete(
-            natural_language_command,
-            schemas,
-            database_type="postgresql"
-        )
-        
-        if not translation_result["success"]:
-            await ctx.error(f"Failed to translate command: {translation_result.get('error', 'Unknown error')}")
-            return {
-                "success": False,
-                "message": "Failed to translate natural language to SQL",
-                "error": translation_result.get('error')
-            }
-        
-        sql_query = translation_result["sql_query"]
-        await ctx.warning(f"Generated DELETE SQL: {sql_query}")
-        
-        # Critical safety warning for DELETE
-        await ctx.warning("WARNING: About to execute DELETE statement. This operation cannot be undone!")
-        
-        # Execute the DELETE query
-        query_result = await db_manager.execute_query(sql_query)
-        
-        if not query_result.success:
-            await ctx.error(f"DELETE execution failed: {query_result.error_message}")
-            return {
-                "success": False,
-                "message": "DELETE statement execution failed",
-                "error": query_result.error_message,
-                "generated_sql": sql_query
-            }
-        
-        await ctx.warning(f"Data deleted successfully, {query_result.row_count} rows affected")
-        
-        return {
-            "success": True,
-            "message": f"Data deleted successfully, {query_result.row_count} rows affected",
-            "original_command": natural_language_command,
-            "generated_sql": sql_query,
-            "affected_rows": query_result.row_count,
-            "warning": "Deletion completed - this operation cannot be undone"
-        }
-        
-    except Exception as e:
-        await ctx.error(f"Error processing data deletion: {str(e)}")
-        return {
-            "success": False,
-            "message": "Error processing data deletion command",
-            "error": str(e)
-        }
+    return await _run_data_command(ctx, natural_language_command, _DELETE)